@@ -25,6 +25,7 @@ class ArchitectureRunRequest:
     full_log_previews: bool
     api_log: Optional[Callable[[str], None]] = None
     architecture_config: Optional[Mapping[str, Any]] = None
+    payload_size_telemetry: bool = True
 
 
 class AgentArchitecture(Protocol):
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from runtime.agent_runtime import AgentRuntime
-from runtime.backend_factory import build_backend
+from runtime.backend_factory import build_backend, close_backend
 
 from agent_architectures.base import ArchitectureRunRequest, AgentArchitecture, filter_tool_schemas
 from agent_architectures.constants import ARCHITECTURE_NONE
@@ -32,11 +32,15 @@ class LegacyArchitecture(AgentArchitecture):
             max_wall_time_s=request.max_wall_time_s,
             termination_tool=request.termination_tool,
             mode_name=request.mode_name,
+            measure_payload_sizes=request.payload_size_telemetry,
         )
-        return runtime.run(
-            task=request.task,
-            system_prompt=request.system_prompt,
-            initial_user_message=request.initial_user_message,
-            tool_schemas=tool_schemas,
-            decoding_defaults=dict(request.decoding_defaults or {}),
-        )
+        try:
+            return runtime.run(
+                task=request.task,
+                system_prompt=request.system_prompt,
+                initial_user_message=request.initial_user_message,
+                tool_schemas=tool_schemas,
+                decoding_defaults=dict(request.decoding_defaults or {}),
+            )
+        finally:
+            close_backend(backend)
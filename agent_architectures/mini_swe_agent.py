@@ -6,7 +6,7 @@ import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, Mapping, MutableMapping, Sequence
 
-from runtime.backend_factory import build_backend
+from runtime.backend_factory import build_backend, close_backend
 from runtime.schemas import AgentResult
 
 from agent_architectures.base import ArchitectureRunRequest, AgentArchitecture, filter_tool_schemas
@@ -16,6 +16,7 @@ from agent_architectures.telemetry_adapter import (
     json_size_bytes,
     pick_repo_metadata,
     serialize_tool_message,
+    unmeasured_size_bytes,
 )
 
 NO_TOOL_CALL_REPAIR_INSTRUCTION = (
@@ -383,6 +384,7 @@ class _MiniToolEnvironment:
         run_state: _MiniRunState,
         submitted_exc: type[BaseException],
         limits_exceeded_exc: type[BaseException],
+        measure_payload_sizes: bool = True,
     ) -> None:
         self._tool_registry = tool_registry
         self._allowed_tools = set(allowed_tools)
@@ -393,6 +395,7 @@ class _MiniToolEnvironment:
         self._submitted_exc = submitted_exc
         self._limits_exceeded_exc = limits_exceeded_exc
         self._started_at = time.monotonic()
+        self._json_size_bytes = json_size_bytes if measure_payload_sizes else unmeasured_size_bytes
 
     def serialize(self) -> dict[str, Any]:
         return {
@@ -463,7 +466,7 @@ class _MiniToolEnvironment:
             "executed": False,
             "success": False,
             "error_code": "tool_error",
-            "args_size_bytes": json_size_bytes(arguments),
+            "args_size_bytes": self._json_size_bytes(arguments),
             "result_size_bytes": 0,
             "latency_ms": 0,
             "return_code": None,
@@ -520,7 +523,7 @@ class _MiniToolEnvironment:
                 "executed": True,
                 "success": success,
                 "error_code": error_code,
-                "result_size_bytes": json_size_bytes(tool_result),
+                "result_size_bytes": self._json_size_bytes(tool_result),
                 "latency_ms": latency_ms,
                 "return_code": return_code,
             }
@@ -592,6 +595,7 @@ class MiniSweAgentArchitecture(AgentArchitecture):
             run_state=run_state,
             submitted_exc=submitted_exc,
             limits_exceeded_exc=limits_exc,
+            measure_payload_sizes=request.payload_size_telemetry,
         )
 
         agent_config = agent_config_cls(
@@ -606,7 +610,10 @@ class MiniSweAgentArchitecture(AgentArchitecture):
             run_config=run_config,
         )
 
-        run_result = agent.run({"instruction": request.initial_user_message})
+        try:
+            run_result = agent.run({"instruction": request.initial_user_message})
+        finally:
+            close_backend(backend)
 
         final_artifact = run_state.submitted_artifact
         if not final_artifact and isinstance(run_result, Mapping):
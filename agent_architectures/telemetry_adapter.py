@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, Mapping
 
+from runtime import json_codec
+
 MAX_TOOL_MESSAGE_CHARS = 12000
 
 
 def json_size_bytes(payload: Any) -> int:
-    """Approximate payload size as UTF-8 JSON bytes."""
+    """Approximate payload size as compact UTF-8 JSON bytes."""
 
     try:
-        serialized = json.dumps(payload, ensure_ascii=False, default=str)
+        return len(json_codec.dumps(payload, default=str))
     except Exception:
-        serialized = str(payload)
-    return len(serialized.encode("utf-8", errors="ignore"))
+        return len(str(payload).encode("utf-8", errors="ignore"))
+
+
+def unmeasured_size_bytes(payload: Any) -> int:
+    """Stand-in size probe used when payload size telemetry is disabled."""
+
+    return 0
 
 
 def truncate_text(text: str, limit: int) -> str:
@@ -28,7 +34,7 @@ def serialize_tool_message(payload: Any) -> str:
     """Serialize tool payload using the legacy runtime truncation policy."""
 
     try:
-        serialized = json.dumps(payload, ensure_ascii=False, default=str)
+        serialized = json_codec.dumps(payload, default=str).decode("utf-8")
     except Exception:
         serialized = str(payload)
     return truncate_text(serialized, MAX_TOOL_MESSAGE_CHARS)
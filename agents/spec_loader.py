@@ -1,12 +1,19 @@
+import copy
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Set, Tuple
 
 import yaml
 
 from agent_architectures.constants import ARCHITECTURE_NONE, normalize_architecture_id
 from skills.loader import load_skills
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class AgentSpec:
@@ -24,6 +31,56 @@ class AgentSpec:
     agent_architecture_config: Dict[str, Any]
 
 
+@dataclass(frozen=True)
+class _CachedLoad:
+    """Memoized `AgentSpecLoader.load` result plus the file state it was built from."""
+
+    spec: AgentSpec
+    prompt: str
+    allowed_tools: Optional[FrozenSet[str]]
+    dependencies: Tuple[Path, ...]
+    fingerprint: Tuple[Optional[Tuple[int, int]], ...]
+
+
+# Process-wide so each run's fresh loader reuses profiles parsed by earlier runs.
+_LOAD_CACHE_MAX = 32
+_LOAD_CACHE: "OrderedDict[Tuple[Any, ...], _CachedLoad]" = OrderedDict()
+_LOAD_CACHE_LOCK = threading.Lock()
+
+
+def _fingerprint_files(paths: Tuple[Path, ...]) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """Return `(mtime_ns, size)` per path, using None for files that do not exist."""
+
+    fingerprint: List[Optional[Tuple[int, int]]] = []
+    for file_path in paths:
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            fingerprint.append(None)
+            continue
+        fingerprint.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+def _thaw_spec(spec: AgentSpec) -> AgentSpec:
+    """Hand callers a private copy of a cached spec, nested dicts and lists included."""
+
+    return copy.deepcopy(spec)
+
+
+def _thaw_tools(allowed_tools: Optional[FrozenSet[str]]) -> Optional[Set[str]]:
+    """Hand callers a private mutable copy of a cached allowlist."""
+
+    return set(allowed_tools) if allowed_tools is not None else None
+
+
+@lru_cache(maxsize=64)
+def _render_skills_placeholder(template: str, skills_text: str) -> str:
+    """Substitute `{skills}` once per distinct template/skills pair."""
+
+    return template.replace("{skills}", skills_text)
+
+
 class AgentSpecLoader:
     """Loader for agent YAML profiles and resolved skill prompt text."""
 
@@ -40,8 +97,46 @@ class AgentSpecLoader:
     ) -> Tuple[AgentSpec, str, Optional[Set[str]]]:
         """Load agent spec, render final system prompt, and derive allowed tools."""
 
+        stat = path.stat()
+        key = (
+            str(path.resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            runtime_mode,
+            str(self.base_dir.resolve()),
+        )
+        with _LOAD_CACHE_LOCK:
+            cached = _LOAD_CACHE.get(key)
+            if cached is not None:
+                _LOAD_CACHE.move_to_end(key)
+        if cached is not None and _fingerprint_files(cached.dependencies) == cached.fingerprint:
+            return _thaw_spec(cached.spec), cached.prompt, _thaw_tools(cached.allowed_tools)
+
+        spec, prompt, allowed_tools, dependencies = self._load_uncached(path, runtime_mode=runtime_mode)
+        entry = _CachedLoad(
+            spec=spec,
+            prompt=prompt,
+            allowed_tools=frozenset(allowed_tools) if allowed_tools is not None else None,
+            dependencies=dependencies,
+            fingerprint=_fingerprint_files(dependencies),
+        )
+        with _LOAD_CACHE_LOCK:
+            _LOAD_CACHE[key] = entry
+            _LOAD_CACHE.move_to_end(key)
+            while len(_LOAD_CACHE) > _LOAD_CACHE_MAX:
+                _LOAD_CACHE.popitem(last=False)
+        return _thaw_spec(spec), prompt, _thaw_tools(entry.allowed_tools)
+
+    def _load_uncached(
+        self,
+        path: Path,
+        *,
+        runtime_mode: Optional[Literal["patch_only", "tools_enabled"]],
+    ) -> Tuple[AgentSpec, str, Optional[Set[str]], Tuple[Path, ...]]:
+        """Parse the profile from disk and report the extra files the result depends on."""
+
         with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         prompt_template = self._resolve_prompt_template(data, path)
         tools = self._normalize_tools_field(data["tools"]) if "tools" in data else None
         spec = AgentSpec(
@@ -66,7 +161,11 @@ class AgentSpecLoader:
             has_skills=bool(spec.skills),
         )
         prompt = self.render_prompt(spec, skills_text, runtime_mode=runtime_mode)
-        return spec, prompt, allowed_tools
+        dependencies = [skill_dir / "SKILL.md" for skill_dir in skill_dirs]
+        prompt_file = data.get("prompt_file")
+        if isinstance(prompt_file, str) and prompt_file.strip():
+            dependencies.extend(self._prompt_path_candidates(prompt_file.strip(), path))
+        return spec, prompt, allowed_tools, tuple(dependencies)
 
     def render_prompt(
         self,
@@ -82,8 +181,9 @@ class AgentSpecLoader:
             raise ValueError(
                 "Prompt template is missing required `{skills}` placeholder while skills are configured"
             )
-        base = base.replace("{skills}", skills_text)
-        return base
+        if "{skills}" not in base:
+            return base
+        return _render_skills_placeholder(base, skills_text)
 
     def _resolve_prompt_template(self, data: Dict[str, Any], agent_path: Path) -> str:
         """Resolve prompt text from inline template or external prompt file."""
@@ -97,10 +197,20 @@ class AgentSpecLoader:
         if prompt_file is not None:
             if not isinstance(prompt_file, str) or not prompt_file.strip():
                 raise ValueError("`prompt_file` must be a non-empty string path")
-            prompt_path = self._resolve_prompt_path(prompt_file.strip(), agent_path)
-            if not prompt_path.exists():
-                raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
-            return prompt_path.read_text(encoding="utf-8")
+            candidates = self._prompt_path_candidates(prompt_file.strip(), agent_path)
+            for prompt_path in candidates:
+                try:
+                    raw_bytes = prompt_path.read_bytes()
+                except FileNotFoundError:
+                    continue
+                break
+            else:
+                raise FileNotFoundError(f"Prompt file not found: {candidates[-1]}")
+            text = raw_bytes.decode("utf-8")
+            if "\r" in text:
+                # Match the universal-newline translation `read_text` used to apply.
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            return text
 
         if prompt_template is None:
             raise ValueError("Missing required prompt definition: set `prompt_template` or `prompt_file`")
@@ -108,17 +218,13 @@ class AgentSpecLoader:
             raise ValueError("`prompt_template` must be a string")
         return prompt_template
 
-    def _resolve_prompt_path(self, prompt_file: str, agent_path: Path) -> Path:
-        """Resolve prompt-file path relative to agent file first, then repo base."""
+    def _prompt_path_candidates(self, prompt_file: str, agent_path: Path) -> Tuple[Path, ...]:
+        """List prompt-file locations in lookup order: agent file dir first, then repo base."""
 
         raw = Path(prompt_file)
         if raw.is_absolute():
-            return raw
-
-        candidate_agent_dir = agent_path.parent / raw
-        if candidate_agent_dir.exists():
-            return candidate_agent_dir
-        return self.base_dir / raw
+            return (raw,)
+        return (agent_path.parent / raw, self.base_dir / raw)
 
     def _normalize_tools_field(self, raw_tools: Any) -> List[str]:
         """Normalize agent `tools` field to a deduplicated list of tool names."""
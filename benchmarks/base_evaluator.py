@@ -1,12 +1,48 @@
 from __future__ import annotations
 
+import mmap
+import os
 import re
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from runtime.config_models import RunConfig
 
+_REPORT_RE = re.compile(r"Report written to\s+(\S+\.json)")
+_REPORT_BYTES_RE = re.compile(rb"Report written to\s+(\S+\.json)")
+# Only this much of each captured log is kept in memory; the full log stays on disk.
+_LOG_TAIL_BYTES = 64 * 1024
+
+
+def _read_log_tail(path: Path, limit: int = _LOG_TAIL_BYTES) -> str:
+    """Decode the last `limit` bytes of a captured harness log, noting where the rest lives."""
+
+    with path.open("rb") as handle:
+        size = handle.seek(0, os.SEEK_END)
+        handle.seek(max(0, size - limit))
+        data = handle.read()
+    text = data.decode("utf-8", errors="replace")
+    if size > limit:
+        return f"[... {size - limit} earlier bytes omitted; full log: {path}]\n{text}"
+    return text
+
+
+def _report_paths_in_log(path: Path) -> List[str]:
+    """Scan a captured harness stdout log for `Report written to` paths without loading it."""
+
+    try:
+        with path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                return [
+                    raw.decode("utf-8", errors="replace")
+                    for raw in _REPORT_BYTES_RE.findall(view)
+                ]
+    except FileNotFoundError:
+        return []
+
 
 class BaseHarnessEvaluator:
     """Shared harness execution flow for benchmark evaluators."""
@@ -17,6 +53,7 @@ class BaseHarnessEvaluator:
         self.last_summary_report: Optional[Path] = None
         self.last_harness_log_root: Optional[Path] = None
         self._workdir: Path = Path.cwd()
+        self._stdout_log: Optional[Path] = None
 
     def run_harness(
         self,
@@ -45,9 +82,29 @@ class BaseHarnessEvaluator:
         run_root.mkdir(parents=True, exist_ok=True)
 
         cmd = self.build_command(predictions_path.resolve(), run_id, config)
-        proc = subprocess.run(cmd, shell=True, cwd=workdir, capture_output=True, text=True)
-
-        self.last_summary_report = self._relocate_summary_report(stdout=proc.stdout, run_id=run_id, run_root=run_root)
+        # Stream harness output straight to files instead of buffering it through pipes.
+        stdout_path = run_root / "harness.stdout.log"
+        stderr_path = run_root / "harness.stderr.log"
+        with stdout_path.open("wb") as stdout_file, stderr_path.open("wb") as stderr_file:
+            try:
+                raw_proc = subprocess.run(cmd, cwd=workdir, stdout=stdout_file, stderr=stderr_file)
+            except OSError as exc:
+                # Without a shell a missing harness binary raises instead of exiting 127;
+                # keep reporting it as a failed harness run the way `/bin/sh` did.
+                stderr_file.write(f"{exc}\n".encode("utf-8", errors="replace"))
+                raw_proc = subprocess.CompletedProcess(args=cmd, returncode=127)
+        proc = subprocess.CompletedProcess(
+            args=raw_proc.args,
+            returncode=raw_proc.returncode,
+            stdout=_read_log_tail(stdout_path),
+            stderr=_read_log_tail(stderr_path),
+        )
+
+        # `proc.stdout` is only a tail; the default resolver also scans the full log file.
+        self._stdout_log = stdout_path
+        self.last_summary_report = self._relocate_summary_report(
+            stdout=proc.stdout, run_id=run_id, run_root=run_root
+        )
         self.last_harness_log_root = self.relocate_harness_logs(run_id=run_id, run_root=run_root)
 
         if self.last_summary_report:
@@ -56,15 +113,16 @@ class BaseHarnessEvaluator:
             proc.stdout = f"{proc.stdout.rstrip()}\nHarness logs relocated to {self.last_harness_log_root}\n"
         return proc
 
-    def build_command(self, predictions_path: Path, run_id: str, config: RunConfig) -> str:
-        """Build the benchmark-specific harness command line."""
+    def build_command(self, predictions_path: Path, run_id: str, config: RunConfig) -> List[str]:
+        """Build the benchmark-specific harness argv; it is executed directly, without a shell."""
 
         raise NotImplementedError
 
     def resolve_summary_report(self, stdout: str, run_id: str, run_root: Path) -> Optional[Path]:
         """Resolve report path from harness stdout or canonical run-root location."""
 
-        matches = re.findall(r"Report written to\s+([^\s]+\.json)", stdout or "")
+        matches = _report_paths_in_log(self._stdout_log) if self._stdout_log is not None else []
+        matches.extend(_REPORT_RE.findall(stdout or ""))
         for raw_path in reversed(matches):
             candidate = Path(raw_path)
             if not candidate.is_absolute():
@@ -91,13 +149,13 @@ class BaseHarnessEvaluator:
             return None
 
         destination = run_root / "report.json"
-        source_resolved = source.resolve(strict=False)
-        destination_resolved = destination.resolve(strict=False)
-        if source_resolved == destination_resolved:
-            return destination_resolved
-
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        if destination.exists():
-            destination.unlink()
-        source.replace(destination)
+        try:
+            if source.samefile(destination):
+                return destination.resolve(strict=False)
+        except FileNotFoundError:
+            pass
+
+        # `run_harness` creates `run_root` before the harness runs, so no mkdir is needed here.
+        # `os.replace` atomically overwrites an existing destination on POSIX and Windows.
+        os.replace(os.fspath(source), os.fspath(destination))
         return destination.resolve(strict=False)
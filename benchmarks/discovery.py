@@ -2,46 +2,75 @@ from __future__ import annotations
 
 import importlib
 import inspect
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Type
+from typing import Any, Dict, Tuple, Type
 
 
-def _is_adapter_candidate(value: Any) -> bool:
-    """Check whether a class exposes the required benchmark adapter surface."""
-
-    if not inspect.isclass(value):
-        return False
-    required_methods = (
+_REQUIRED_ADAPTER_METHODS = frozenset(
+    {
         "from_config",
         "load_tasks",
         "workspace_context_for_task",
         "to_prediction_record",
         "get_evaluator",
-    )
-    if not isinstance(getattr(value, "benchmark_name", None), str):
+    }
+)
+
+
+def _is_adapter_candidate(value: Any) -> bool:
+    """Check whether a class exposes the required benchmark adapter surface."""
+
+    if not inspect.isclass(value):
         return False
-    return all(callable(getattr(value, method, None)) for method in required_methods)
+    return _class_has_adapter_surface(value)
+
+
+@lru_cache(maxsize=256)
+def _class_has_adapter_surface(cls: type) -> bool:
+    """Memoized structural check; each class is inspected at most once per process."""
+
+    if not isinstance(getattr(cls, "benchmark_name", None), str):
+        return False
+    if not _REQUIRED_ADAPTER_METHODS.issubset(dir(cls)):
+        return False
+    return all(callable(getattr(cls, method)) for method in _REQUIRED_ADAPTER_METHODS)
 
 
 def discover_benchmark_adapters() -> Dict[str, Type[Any]]:
     """Import `benchmarks/*/adapter.py` modules and register adapter classes."""
 
+    return dict(_discover_benchmark_adapters_cached())
+
+
+@lru_cache(maxsize=1)
+def _discover_benchmark_adapters_cached() -> Tuple[Tuple[str, Type[Any]], ...]:
+    """Run adapter discovery once per process; the adapter tree is static at runtime."""
+
     discovered: Dict[str, Type[Any]] = {}
     root = Path(__file__).resolve().parent
-    for child in sorted(root.iterdir()):
-        if not child.is_dir():
-            continue
-        if child.name.startswith("_") or child.name in {"__pycache__"}:
-            continue
-        adapter_file = child / "adapter.py"
-        if not adapter_file.exists():
+    # DirEntry caches the entry type from the directory read, so is_dir() costs no extra stat.
+    with os.scandir(root) as entries:
+        package_dirs = sorted(
+            (
+                entry
+                for entry in entries
+                if entry.is_dir()
+                and not entry.name.startswith("_")
+                and entry.name != "__pycache__"
+            ),
+            key=lambda entry: entry.name,
+        )
+    for entry in package_dirs:
+        if not os.path.isfile(os.path.join(entry.path, "adapter.py")):
             continue
 
-        module_name = f"benchmarks.{child.name}.adapter"
+        module_name = f"benchmarks.{entry.name}.adapter"
         module = importlib.import_module(module_name)
         adapter_cls = None
-        for _, obj in inspect.getmembers(module, inspect.isclass):
-            if obj.__module__ != module.__name__:
+        for obj in vars(module).values():
+            if not inspect.isclass(obj) or obj.__module__ != module.__name__:
                 continue
             if _is_adapter_candidate(obj):
                 adapter_cls = obj
@@ -60,4 +89,4 @@ def discover_benchmark_adapters() -> Dict[str, Type[Any]]:
                 f"{discovered[benchmark_name].__name__} and {adapter_cls.__name__}"
             )
         discovered[benchmark_name] = adapter_cls
-    return discovered
+    return tuple(discovered.items())
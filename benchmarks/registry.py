@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from benchmarks.discovery import discover_benchmark_adapters
 
@@ -18,16 +18,18 @@ class BenchmarkRegistry:
         self._registry.update(dict(self.DEFAULT_OVERRIDES))
         if overrides:
             self._registry.update(dict(overrides))
+        # The registry is immutable after init, so sort the names once.
+        self._sorted_names: Tuple[str, ...] = tuple(sorted(self._registry))
 
     def get_adapter(self, name: str):
         """Return adapter class for a benchmark name or raise a deterministic error."""
 
         if name not in self._registry:
-            supported = ", ".join(sorted(self._registry.keys()))
+            supported = ", ".join(self._sorted_names)
             raise KeyError(f"Unknown benchmark '{name}'. Supported benchmarks: {supported}")
         return self._registry[name]
 
     def list_benchmarks(self) -> list[str]:
         """List all available benchmark names in stable order."""
 
-        return sorted(self._registry.keys())
+        return list(self._sorted_names)
@@ -1,11 +1,42 @@
-import json
+import mmap
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, cast
+from typing import Any, Dict, Iterable, List, Mapping, Optional, cast
 
+from runtime import json_codec
 from runtime.config_models import RunConfig
 from runtime.schemas import BenchmarkTask
 from runtime.task_context import TaskWorkspaceContext
 
+# Dataset fields probed in priority order for the task instruction text.
+_INSTRUCTION_KEYS = ("problem_statement", "task_description", "prompt", "issue", "title")
+# Every dataset column `_record_to_task` and the repo filter read.
+_TASK_COLUMNS = ("instance_id", *_INSTRUCTION_KEYS, "repo")
+
+
+@lru_cache(maxsize=4)
+def _load_hf_split(dataset_name: str, split: str) -> Any:
+    """Load and column-project one HF split, memoized for the life of the process."""
+
+    from datasets import load_dataset
+
+    ds = load_dataset(dataset_name, split=split)
+    # Drop unused columns (patches, test lists, hints) so Arrow never decodes them per row.
+    return ds.select_columns([name for name in _TASK_COLUMNS if name in ds.column_names])
+
+
+def _has_string_schema(ds: Any) -> bool:
+    """Return True when `instance_id` and every projected column are typed as Arrow strings."""
+
+    from datasets import Value
+
+    features = ds.features
+    return "instance_id" in features and all(
+        isinstance(feature, Value) and feature.dtype in ("string", "large_string")
+        for feature in features.values()
+    )
+
 
 class SWEbenchVerifiedAdapter:
     """SWE-bench task loader and prediction serializer."""
@@ -50,41 +81,62 @@ class SWEbenchVerifiedAdapter:
         if not path.exists():
             raise ValueError(f"Missing dataset split file: {path}")
 
-        tasks: List[BenchmarkTask] = []
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                record = json.loads(line)
-                if not isinstance(record, dict):
-                    raise ValueError(
-                        f"Invalid record type in {path}: expected object, got {type(record).__name__}"
-                    )
-                if not self._record_matches_repo_filter(cast(Mapping[str, Any], record)):
-                    continue
-                task = self._record_to_task(cast(Mapping[str, Any], record))
-                tasks.append(task)
-                if selector and len(tasks) >= selector:
-                    break
-        return tasks
+        if path.stat().st_size == 0:
+            return []
+        # Map the file and split lines in C; each line is decoded on its own, and a small
+        # selector stops reading early.
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            rows = (json_codec.loads(line) for line in iter(mm.readline, b""))
+            return self._tasks_from_local_rows(rows, path, selector)
+
+    def _tasks_from_local_rows(
+        self, rows: Iterable[Any], path: Path, selector: Optional[int]
+    ) -> List[BenchmarkTask]:
+        """Validate, repo-filter, and bound decoded JSONL rows into tasks."""
+
+        records = (self._require_local_record(row, path) for row in rows)
+        matching = filter(self._record_matches_repo_filter, records)
+        bounded = islice(matching, selector) if selector else matching
+        return [self._record_to_task(record) for record in bounded]
+
+    @staticmethod
+    def _require_local_record(record: Any, path: Path) -> Mapping[str, Any]:
+        """Reject non-object JSONL rows with a file-qualified error."""
+
+        if not isinstance(record, dict):
+            raise ValueError(
+                f"Invalid record type in {path}: expected object, got {type(record).__name__}"
+            )
+        return cast(Mapping[str, Any], record)
 
     def _load_tasks_from_hf(self, split: str, selector: Optional[int]) -> List[BenchmarkTask]:
         """Load a bounded set of tasks from Hugging Face dataset rows."""
 
-        from datasets import load_dataset
-
-        ds = load_dataset(self.dataset_name, split=split)
-        tasks: List[BenchmarkTask] = []
-        for record in ds:  # type: ignore[assignment]
-            if not isinstance(record, dict):
-                raise ValueError(
-                    f"Invalid record type in dataset split '{split}': "
-                    f"expected object, got {type(record).__name__}"
-                )
-            if not self._record_matches_repo_filter(cast(Mapping[str, Any], record)):
-                continue
-            tasks.append(self._record_to_task(cast(Mapping[str, Any], record)))
-            if selector and len(tasks) >= selector:
-                break
-        return tasks
+        ds = _load_hf_split(self.dataset_name, split)
+        # Stream rows lazily so only `selector` matching rows are ever decoded.
+        if _has_string_schema(ds):
+            # The Arrow schema already guarantees str-or-None values, so skip per-row type checks.
+            records: Iterable[Mapping[str, Any]] = iter(ds)
+            to_task = self._record_to_task_trusted
+        else:
+            records = (
+                self._require_hf_record(record, split) for record in ds  # type: ignore[arg-type]
+            )
+            to_task = self._record_to_task
+        matching = filter(self._record_matches_repo_filter, records)
+        bounded = islice(matching, selector) if selector else matching
+        return [to_task(record) for record in bounded]
+
+    @staticmethod
+    def _require_hf_record(record: Any, split: str) -> Mapping[str, Any]:
+        """Reject non-object dataset rows with a split-qualified error."""
+
+        if not isinstance(record, dict):
+            raise ValueError(
+                f"Invalid record type in dataset split '{split}': "
+                f"expected object, got {type(record).__name__}"
+            )
+        return cast(Mapping[str, Any], record)
 
     def _repo_allowlist(self) -> Optional[set[str]]:
         """Return exact-match repo allowlist from benchmark params, if configured."""
@@ -126,9 +178,10 @@ class SWEbenchVerifiedAdapter:
         instance_id = instance_id_raw.strip()
 
         instruction = ""
-        for key in ("problem_statement", "task_description", "prompt", "issue", "title"):
+        for key in _INSTRUCTION_KEYS:
             value = record.get(key)
-            if isinstance(value, str) and value.strip():
+            # `isspace` checks for content without allocating; only the chosen value is stripped.
+            if isinstance(value, str) and value and not value.isspace():
                 instruction = value.strip()
                 break
 
@@ -146,6 +199,32 @@ class SWEbenchVerifiedAdapter:
             expected_output_type="patch",
         )
 
+    def _record_to_task_trusted(self, record: Mapping[str, Any]) -> BenchmarkTask:
+        """Convert one schema-checked HF row whose task columns are strings or null."""
+
+        instance_id_raw = record["instance_id"]
+        instance_id = instance_id_raw.strip() if instance_id_raw else ""
+        if not instance_id:
+            raise ValueError(f"Invalid or missing instance_id: {instance_id_raw!r}")
+
+        instruction = ""
+        for key in _INSTRUCTION_KEYS:
+            value = record.get(key)
+            if value and not value.isspace():
+                instruction = value.strip()
+                break
+
+        if not instruction:
+            raise ValueError(f"Empty instruction for instance_id={instance_id}")
+
+        repo = record.get("repo")
+        return BenchmarkTask(
+            task_id=instance_id,
+            instruction=instruction,
+            resources={"repo": repo} if repo and not repo.isspace() else {},
+            expected_output_type="patch",
+        )
+
     def workspace_context_for_task(self, task: BenchmarkTask) -> TaskWorkspaceContext:
         """Resolve task workspace/tool readiness context for SWE-bench tasks."""
 
@@ -221,11 +300,7 @@ class SWEbenchVerifiedAdapter:
     ) -> Dict[str, Any]:
         """Serialize predictions into the SWE-bench JSONL schema."""
 
-        repo = None
-        if metadata and metadata.get("repo"):
-            repo = metadata.get("repo")
-        elif task.resources and task.resources.get("repo"):
-            repo = task.resources.get("repo")
+        repo = (metadata or {}).get("repo") or (task.resources or {}).get("repo") or None
         return {
             "instance_id": task.task_id,
             "model_patch": artifact,
@@ -1,10 +1,20 @@
+import errno
 import json
+import os
+import shlex
 import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from benchmarks.base_evaluator import BaseHarnessEvaluator
+from runtime import json_codec
 from runtime.config_models import RunConfig
 
+# Renames release the GIL, so a small pool overlaps per-instance filesystem round-trips.
+_MAX_MOVE_WORKERS = 16
+
 
 class SWEbenchEvaluator(BaseHarnessEvaluator):
     """SWE-bench harness evaluator with canonical report/log relocation."""
@@ -14,63 +24,68 @@ class SWEbenchEvaluator(BaseHarnessEvaluator):
 
         super().__init__()
 
-    def build_command(self, predictions_path: Path, run_id: str, config: RunConfig) -> str:
-        """Validate predictions schema and build harness CLI command."""
+    def build_command(self, predictions_path: Path, run_id: str, config: RunConfig) -> list[str]:
+        """Validate predictions schema and build harness CLI argv."""
 
         run_root = Path(config.output.artifacts_dir) / run_id
         abs_predictions = predictions_path.resolve()
-        self._validate_predictions_schema(abs_predictions)
-        harness_predictions = self._prepare_harness_predictions(
-            predictions_path=abs_predictions, run_root=run_root
-        )
-        return (
-            f"{config.evaluation.harness_cmd} "
-            f"-d {config.benchmark.dataset_name} "
-            f"-s {config.benchmark.split} "
-            f"-p {harness_predictions.resolve()} "
-            f"-id {run_id} "
-            f"--report_dir {run_root.resolve()}"
-        )
-
-    def _prepare_harness_predictions(self, predictions_path: Path, run_root: Path) -> Path:
-        """Create a normalized shadow predictions file only when patch newlines are missing."""
-
-        changed = False
-        output_lines: list[str] = []
-        with predictions_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    output_lines.append(line)
-                    continue
-                rec = json.loads(line)
-                model_patch = rec.get("model_patch") if isinstance(rec, dict) else None
-                if isinstance(model_patch, str) and model_patch and not model_patch.endswith("\n"):
-                    rec = dict(rec)
-                    rec["model_patch"] = model_patch + "\n"
-                    line = json.dumps(rec) + "\n"
-                    changed = True
-                output_lines.append(line)
-
-        if not changed:
-            return predictions_path
-
+        harness_predictions = abs_predictions
+        patch_lines = self._validate_predictions_schema(abs_predictions)
+        if patch_lines:
+            harness_predictions = self._prepare_harness_predictions(
+                predictions_path=abs_predictions, run_root=run_root, patch_lines=patch_lines
+            )
+        return [
+            *shlex.split(config.evaluation.harness_cmd),
+            "-d",
+            config.benchmark.dataset_name,
+            "-s",
+            config.benchmark.split,
+            "-p",
+            str(harness_predictions.resolve()),
+            "-id",
+            run_id,
+            "--report_dir",
+            str(run_root.resolve()),
+        ]
+
+    def _prepare_harness_predictions(
+        self, predictions_path: Path, run_root: Path, patch_lines: set[int]
+    ) -> Path:
+        """Write a shadow predictions file with trailing newlines added to `model_patch`."""
+
+        # Stream the rewrite row by row so memory stays flat for large prediction sets;
+        # only the rows validation flagged are decoded again, the rest are copied as bytes.
         shadow_predictions = run_root / "predictions.for_harness.jsonl"
         shadow_predictions.parent.mkdir(parents=True, exist_ok=True)
-        shadow_predictions.write_text("".join(output_lines), encoding="utf-8")
+        with predictions_path.open("rb") as src, shadow_predictions.open("wb") as dst:
+            dst.writelines(
+                self._with_patch_newline(line) if line_no in patch_lines else line
+                for line_no, line in enumerate(src, start=1)
+            )
         return shadow_predictions
 
-    def _validate_predictions_schema(self, predictions_path: Path) -> None:
-        """Require `model_name_or_path` on every prediction row before harness run."""
+    @staticmethod
+    def _with_patch_newline(line: bytes) -> bytes:
+        """Return `line` re-encoded with a newline appended to its `model_patch`."""
+
+        rec = dict(json_codec.loads(line))
+        rec["model_patch"] = rec["model_patch"] + "\n"
+        return json_codec.dumps(rec) + b"\n"
+
+    def _validate_predictions_schema(self, predictions_path: Path) -> set[int]:
+        """Require `model_name_or_path` on every row; return lines whose patch needs a newline."""
 
         if predictions_path.suffix != ".jsonl":
             raise ValueError(f"Predictions must be a .jsonl file: {predictions_path}")
 
-        with predictions_path.open("r", encoding="utf-8") as f:
+        patch_lines: set[int] = set()
+        with predictions_path.open("rb") as f:
             for line_no, line in enumerate(f, start=1):
                 if not line.strip():
                     continue
                 try:
-                    rec = json.loads(line)
+                    rec = json_codec.loads(line)
                 except json.JSONDecodeError as exc:
                     raise ValueError(
                         f"Invalid JSON in predictions file at line {line_no}: {predictions_path}"
@@ -84,6 +99,10 @@ class SWEbenchEvaluator(BaseHarnessEvaluator):
                     raise ValueError(
                         f"Missing required `model_name_or_path` at line {line_no} in {predictions_path}"
                     )
+                model_patch = rec.get("model_patch")
+                if isinstance(model_patch, str) and model_patch and not model_patch.endswith("\n"):
+                    patch_lines.add(line_no)
+        return patch_lines
 
     def relocate_harness_logs(self, run_id: str, run_root: Path) -> "Path | None":
         """Move per-instance harness logs under `artifacts/<run_id>/evaluation`."""
@@ -97,24 +116,66 @@ class SWEbenchEvaluator(BaseHarnessEvaluator):
             return None
 
         if destination.exists():
-            shutil.rmtree(destination)
+            _discard_tree(destination)
         destination.mkdir(parents=True, exist_ok=True)
 
-        for model_dir in sorted(source.iterdir()):
-            if not model_dir.is_dir():
-                continue
-            model_name = model_dir.name
-            for instance_dir in sorted(model_dir.iterdir()):
-                if not instance_dir.is_dir():
-                    continue
-                target = destination / instance_dir.name
-                if target.exists():
-                    target = destination / f"{instance_dir.name}__{model_name}"
+        # `destination` starts empty, so track collisions in memory instead of stat'ing targets.
+        # Names are resolved serially; only the independent renames run concurrently.
+        taken: set[str] = set()
+        moves: list[tuple[str, str]] = []
+        for model_entry in _sorted_subdirs(source):
+            model_name = model_entry.name
+            for instance_entry in _sorted_subdirs(model_entry.path):
+                name = instance_entry.name
+                if name in taken:
+                    name = f"{instance_entry.name}__{model_name}"
                     suffix = 2
-                    while target.exists():
-                        target = destination / f"{instance_dir.name}__{model_name}_{suffix}"
+                    while name in taken:
+                        name = f"{instance_entry.name}__{model_name}_{suffix}"
                         suffix += 1
-                shutil.move(str(instance_dir), str(target))
+                taken.add(name)
+                moves.append((instance_entry.path, os.path.join(destination, name)))
 
-        shutil.rmtree(source, ignore_errors=True)
+        if moves:
+            with ThreadPoolExecutor(max_workers=min(_MAX_MOVE_WORKERS, len(moves))) as pool:
+                # Drain the iterator so the first failed move is re-raised here.
+                list(pool.map(_move_dir, *zip(*moves)))
+
+        _discard_tree(source)
         return destination.resolve(strict=False)
+
+
+def _discard_tree(path: Path) -> None:
+    """Rename `path` aside atomically, then delete it on a background thread."""
+
+    stash = path.with_name(f".{path.name}.discard-{uuid.uuid4().hex}")
+    try:
+        os.rename(path, stash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    # Non-daemon so the interpreter finishes the delete before exiting instead of leaking `stash`.
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(stash,),
+        kwargs={"ignore_errors": True},
+        name=f"discard-{path.name}",
+    ).start()
+
+
+def _sorted_subdirs(path: "str | os.PathLike[str]") -> list[os.DirEntry[str]]:
+    """List child directories by name; sorting keeps collision suffixes deterministic."""
+
+    with os.scandir(path) as it:
+        return sorted((entry for entry in it if entry.is_dir()), key=lambda entry: entry.name)
+
+
+def _move_dir(source: str, target: str) -> None:
+    """Rename a directory in one syscall, copying only when it crosses filesystems."""
+
+    try:
+        os.replace(source, target)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(source, target)
@@ -1,7 +1,7 @@
-import json
 import time
 from typing import Any, Dict, List, Optional, Set
 
+from runtime import json_codec
 from runtime.model_backend import GenerationResult, ModelBackend
 from runtime.schemas import AgentResult, BenchmarkTask
 from runtime.tools import ToolRegistry
@@ -30,6 +30,7 @@ class AgentRuntime:
         max_completion_tokens: int = 512,
         termination_tool: str = "submit",
         mode_name: str = "patch_only",
+        measure_payload_sizes: bool = True,
     ) -> None:
         """Capture runtime dependencies and loop limits for one execution strategy."""
 
@@ -41,16 +42,16 @@ class AgentRuntime:
         self.max_completion_tokens = max_completion_tokens
         self.termination_tool = termination_tool
         self.mode_name = mode_name
+        self.measure_payload_sizes = measure_payload_sizes
 
     @staticmethod
-    def _json_size_bytes(payload: Any) -> int:
-        """Approximate payload size as UTF-8 JSON bytes."""
+    def _encode_payload(payload: Any) -> bytes:
+        """Encode a tool payload as compact UTF-8 JSON, falling back to its `str` form."""
 
         try:
-            serialized = json.dumps(payload, default=str, ensure_ascii=False)
+            return json_codec.dumps(payload, default=str)
         except Exception:
-            serialized = str(payload)
-        return len(serialized.encode("utf-8", errors="ignore"))
+            return str(payload).encode("utf-8", errors="ignore")
 
     @classmethod
     def _truncate_text(cls, text: str, limit: int) -> str:
@@ -61,14 +62,10 @@ class AgentRuntime:
         return text[:limit] + "...[truncated]"
 
     @classmethod
-    def _tool_message_content(cls, payload: Any) -> str:
-        """Serialize tool results as JSON (with fallback) for consistent model parsing."""
+    def _tool_message_content(cls, encoded_payload: bytes) -> str:
+        """Render an encoded tool result as truncated message text for the model."""
 
-        try:
-            serialized = json.dumps(payload, ensure_ascii=False, default=str)
-        except Exception:
-            serialized = str(payload)
-        return cls._truncate_text(serialized, cls.MAX_TOOL_MESSAGE_CHARS)
+        return cls._truncate_text(encoded_payload.decode("utf-8"), cls.MAX_TOOL_MESSAGE_CHARS)
 
     @staticmethod
     def _resolve_completion_cap(
@@ -108,7 +105,13 @@ class AgentRuntime:
     ) -> AgentResult:
         """Run model/tool loop until submission, timeout, or budget exhaustion."""
 
-        start = time.monotonic()
+        # Bind hot-loop callables once; each turn otherwise repeats the global/attribute lookups.
+        monotonic = time.monotonic
+        execute_tool = self.tool_registry.execute
+        encode_payload = self._encode_payload
+        # Sizes are telemetry only; skip both per-call serializations when disabled.
+        measure_sizes = self.measure_payload_sizes
+        deadline = monotonic() + self.max_wall_time_s
         messages: List[Dict[str, Any]] = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": initial_user_message},
@@ -136,7 +139,7 @@ class AgentRuntime:
         while True:
             halt_invalid_submission = False
             # Enforce wall-clock and tool-call budgets before each model turn.
-            if time.monotonic() - start > self.max_wall_time_s:
+            if monotonic() > deadline:
                 wall_time_exhausted = True
                 loop_exit_reason = "wall_time_exhausted"
                 break
@@ -149,18 +152,22 @@ class AgentRuntime:
             result: GenerationResult = self.backend.generate(messages, tools=tools, decoding=decoding_defaults)
             assistant_msg = {"role": "assistant", "content": result.assistant_text}
             tool_call_ids: List[str] = []
+            # Encode each call's arguments once; the bytes also give `args_size_bytes` below.
+            encoded_arguments: List[bytes] = []
             if result.tool_calls:
                 tool_calls_payload = []
                 for idx, tc in enumerate(result.tool_calls):
                     call_id = f"call_{tool_calls_made}_{idx}"
                     tool_call_ids.append(call_id)
+                    arguments_json = encode_payload(tc.arguments)
+                    encoded_arguments.append(arguments_json)
                     tool_calls_payload.append(
                         {
                             "id": call_id,
                             "type": "function",
                             "function": {
                                 "name": tc.name,
-                                "arguments": json.dumps(tc.arguments),
+                                "arguments": arguments_json.decode("utf-8"),
                             },
                         }
                     )
@@ -210,7 +217,7 @@ class AgentRuntime:
                     "executed": False,
                     "success": False,
                     "error_code": "tool_error",
-                    "args_size_bytes": self._json_size_bytes(tc.arguments),
+                    "args_size_bytes": len(encoded_arguments[idx]) if measure_sizes else 0,
                     "result_size_bytes": 0,
                     "latency_ms": 0,
                     "return_code": None,
@@ -236,17 +243,17 @@ class AgentRuntime:
                     continue
 
                 event["allowed"] = True
-                tool_started = time.monotonic()
+                tool_started = monotonic()
                 execution_exception: Optional[Exception] = None
                 try:
-                    tool_result = self.tool_registry.execute(tc.name, tc.arguments)
+                    tool_result = execute_tool(tc.name, tc.arguments)
                 except Exception as exc:
                     execution_exception = exc
                     tool_result = {
                         "error": f"tool execution exception: {exc.__class__.__name__}: {exc}",
                     }
 
-                latency_ms = int(max(0.0, (time.monotonic() - tool_started) * 1000.0))
+                latency_ms = int(max(0.0, (monotonic() - tool_started) * 1000.0))
                 error_code = "none"
                 success = True
                 return_code: Optional[int] = None
@@ -271,12 +278,14 @@ class AgentRuntime:
                         success = False
                     if isinstance(tool_result.get("returncode"), int):
                         return_code = tool_result.get("returncode")
+                # One encoding feeds both the model-facing message and the size telemetry.
+                encoded_result = encode_payload(tool_result)
                 event.update(
                     {
                         "executed": True,
                         "success": success,
                         "error_code": error_code,
-                        "result_size_bytes": self._json_size_bytes(tool_result),
+                        "result_size_bytes": len(encoded_result) if measure_sizes else 0,
                         "latency_ms": latency_ms,
                         "return_code": return_code,
                     }
@@ -287,7 +296,7 @@ class AgentRuntime:
                         "role": "tool",
                         "name": tc.name,
                         "tool_call_id": tool_call_ids[idx] if idx < len(tool_call_ids) else "unknown",
-                        "content": self._tool_message_content(tool_result),
+                        "content": self._tool_message_content(encoded_result),
                     }
                 )
                 if execution_exception is not None:
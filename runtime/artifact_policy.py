@@ -1,10 +1,43 @@
 import json
 import re
 from dataclasses import dataclass
-from typing import Callable, Dict
+from typing import Callable, Dict, Tuple
+
+from runtime import json_codec
 
 _CANNOT_PRODUCE_OUTPUT_PREFIX = "CANNOT PRODUCE OUTPUT"
 
+# Compiled once at import rather than looked up per artifact.
+_FENCED_BLOCK_RE = re.compile(r"```(?:diff|patch)?\s*([\s\S]*?)```", re.IGNORECASE)
+
+# Inputs that can decode to non-finite floats or lone surrogates, which orjson would turn into
+# `null` or refuse; these keep the stdlib canonical form.
+_STDLIB_JSON_HINT_RE = re.compile(r"NaN|Infinity|[eE][+]?\d{3}|\\u[dD][89a-fA-F]|[\ud800-\udfff]")
+
+_PATCH_BODY_FIRST_CHARS = frozenset("+- ")
+_PATCH_META_PREFIXES = (
+    "diff --git ",
+    "index ",
+    "--- ",
+    "+++ ",
+    "@@",
+    "new file mode ",
+    "deleted file mode ",
+    "old mode ",
+    "new mode ",
+    "rename from ",
+    "rename to ",
+    "similarity index ",
+    "dissimilarity index ",
+    "Binary files ",
+    "\\ No newline at end of file",
+)
+# Fan out by first character so each line is compared against at most a few prefixes.
+_PATCH_META_PREFIXES_BY_FIRST: Dict[str, Tuple[str, ...]] = {
+    first: tuple(prefix for prefix in _PATCH_META_PREFIXES if prefix[0] == first)
+    for first in {prefix[0] for prefix in _PATCH_META_PREFIXES}
+}
+
 
 @dataclass
 class ArtifactPolicyResult:
@@ -18,8 +51,11 @@ class ArtifactPolicyResult:
 def apply_artifact_policy(raw_artifact: str, output_type: str) -> ArtifactPolicyResult:
     """Dispatch artifact handling based on expected output type."""
 
-    normalized_type = (output_type or "text").strip().lower()
-    policy = _POLICIES.get(normalized_type, _normalize_text_artifact)
+    # Callers almost always pass a canonical literal; only normalize on a miss.
+    policy = _POLICIES.get(output_type) if output_type else None
+    if policy is None:
+        normalized_type = (output_type or "text").strip().lower()
+        policy = _POLICIES.get(normalized_type, _normalize_text_artifact)
     return policy(raw_artifact or "")
 
 
@@ -46,17 +82,37 @@ def _normalize_patch_artifact(raw_artifact: str) -> ArtifactPolicyResult:
         return ArtifactPolicyResult(artifact="", valid=False, reason="empty_after_sanitize")
     if not candidate.startswith("diff --git "):
         return ArtifactPolicyResult(artifact="", valid=False, reason="missing_diff_header")
-    if not re.search(r"^---\s+.+$", candidate, flags=re.MULTILINE):
+    if not _has_line_starting_with(candidate, "--- "):
         return ArtifactPolicyResult(artifact="", valid=False, reason="missing_old_file_header")
-    if not re.search(r"^\+\+\+\s+.+$", candidate, flags=re.MULTILINE):
+    if not _has_line_starting_with(candidate, "+++ "):
         return ArtifactPolicyResult(artifact="", valid=False, reason="missing_new_file_header")
-    if not re.search(r"^@@\s+.+\s+@@", candidate, flags=re.MULTILINE):
+    if not _has_hunk_header(candidate):
         return ArtifactPolicyResult(artifact="", valid=False, reason="missing_hunk_header")
     if not candidate.endswith("\n"):
         candidate += "\n"
     return ArtifactPolicyResult(artifact=candidate, valid=True, reason="ok")
 
 
+def _has_line_starting_with(text: str, prefix: str) -> bool:
+    """Return True when any line of `text` starts with `prefix`, via a plain substring scan."""
+
+    return text.startswith(prefix) or f"\n{prefix}" in text
+
+
+def _has_hunk_header(text: str) -> bool:
+    """Return True when some line looks like `@@ <range> @@`."""
+
+    index = 0 if text.startswith("@@ ") else text.find("\n@@ ")
+    while index >= 0:
+        begin = index + 1 if text[index] == "\n" else index
+        end = text.find("\n", begin)
+        # Require a non-empty range between the opening `@@ ` and the closing ` @@`.
+        if text.find(" @@", begin + 4, len(text) if end < 0 else end) >= 0:
+            return True
+        index = text.find("\n@@ ", begin)
+    return False
+
+
 def _normalize_text_artifact(raw_artifact: str) -> ArtifactPolicyResult:
     """Normalize plain-text artifacts with newline and edge whitespace cleanup."""
 
@@ -71,10 +127,13 @@ def _normalize_json_artifact(raw_artifact: str) -> ArtifactPolicyResult:
     if not text:
         return ArtifactPolicyResult(artifact="", valid=False, reason="empty_output")
     try:
-        parsed = json.loads(text)
+        parsed = json_codec.loads(text)
     except json.JSONDecodeError:
         return ArtifactPolicyResult(artifact=text, valid=False, reason="invalid_json")
-    normalized = json.dumps(parsed, sort_keys=True, separators=(",", ":"))
+    if _STDLIB_JSON_HINT_RE.search(text):
+        normalized = json.dumps(parsed, sort_keys=True, separators=(",", ":"))
+    else:
+        normalized = json_codec.dumps(parsed, sort_keys=True).decode("utf-8")
     return ArtifactPolicyResult(artifact=normalized, valid=True, reason="ok")
 
 
@@ -84,11 +143,13 @@ def _extract_diff_candidate(text: str) -> str:
     if text.startswith("diff --git "):
         return text
 
-    for fenced_match in re.finditer(r"```(?:diff|patch)?\s*([\s\S]*?)```", text, flags=re.IGNORECASE):
-        body = fenced_match.group(1).strip()
-        diff_index = body.find("diff --git ")
-        if diff_index >= 0:
-            return body[diff_index:]
+    # Only run the fence regex when the output actually contains a code fence.
+    if "```" in text:
+        for fenced_match in _FENCED_BLOCK_RE.finditer(text):
+            body = fenced_match.group(1).strip()
+            diff_index = body.find("diff --git ")
+            if diff_index >= 0:
+                return body[diff_index:]
 
     diff_index = text.find("diff --git ")
     if diff_index >= 0:
@@ -99,55 +160,41 @@ def _extract_diff_candidate(text: str) -> str:
 def _truncate_non_patch_tail(candidate: str) -> str:
     """Stop patch output at first clear non-patch tail after hunk body starts."""
 
-    allowed_prefixes = (
-        "diff --git ",
-        "index ",
-        "--- ",
-        "+++ ",
-        "@@",
-        "new file mode ",
-        "deleted file mode ",
-        "old mode ",
-        "new mode ",
-        "rename from ",
-        "rename to ",
-        "similarity index ",
-        "dissimilarity index ",
-        "Binary files ",
-        "\\ No newline at end of file",
-    )
-    lines = candidate.splitlines()
-    kept = []
-    saw_diff = False
-    saw_patch_body = False
+    if candidate.startswith("diff --git "):
+        start = 0
+    else:
+        start = candidate.find("\ndiff --git ") + 1
+        if start == 0:
+            return ""
 
-    for line in lines:
-        if line.startswith("diff --git "):
-            saw_diff = True
-            kept.append(line)
-            continue
-        if not saw_diff:
-            continue
-        if not line:
-            kept.append(line)
-            continue
-        if line.startswith(("+", "-", " ")):
-            kept.append(line)
-            saw_patch_body = True
-            continue
-        if line.startswith(allowed_prefixes):
-            kept.append(line)
-            continue
-        if saw_patch_body:
-            break
-        kept.append(line)
-
-    return "\n".join(kept)
+    # Walk line offsets and slice once at the cut point instead of splitting and rejoining.
+    # Splitting on "\n" only (not `splitlines`) keeps \f or \v inside patched source lines.
+    saw_patch_body = False
+    line_start = start
+    length = len(candidate)
+    while line_start < length:
+        line_end = candidate.find("\n", line_start)
+        if line_end < 0:
+            line_end = length
+        if line_end > line_start:
+            first = candidate[line_start]
+            if first in _PATCH_BODY_FIRST_CHARS:
+                saw_patch_body = True
+            else:
+                prefixes = _PATCH_META_PREFIXES_BY_FIRST.get(first)
+                if not (prefixes and candidate.startswith(prefixes, line_start)) and saw_patch_body:
+                    return candidate[start : line_start - 1]
+        line_start = line_end + 1
+
+    return candidate[start:]
 
 
 def _normalize_newlines(text: str) -> str:
     """Normalize CRLF/CR newlines to LF for deterministic downstream parsing."""
 
+    # Most model output is already LF-only; one scan skips both replace passes.
+    if "\r" not in text:
+        return text
     return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
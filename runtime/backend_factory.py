@@ -23,7 +23,17 @@ def build_backend(
             max_retries=backend_config.get("max_retries", 8),
             initial_backoff_s=backend_config.get("initial_backoff_s", 1.0),
             max_backoff_s=backend_config.get("max_backoff_s", 10.0),
+            breaker_failure_threshold=backend_config.get("breaker_failure_threshold", 5),
+            breaker_open_s=backend_config.get("breaker_open_s", 30.0),
             event_logger=event_logger,
             full_log_previews=full_log_previews,
         )
     raise ValueError(f"Unsupported backend type: {backend_type}")
+
+
+def close_backend(backend: Any) -> None:
+    """Release backend transport resources; duck-typed backends without close() are skipped."""
+
+    close = getattr(backend, "close", None)
+    if callable(close):
+        close()
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from copy import deepcopy
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Literal, Optional, Tuple
 
 import yaml
 
 from agent_architectures.constants import ARCHITECTURE_NONE, normalize_architecture_id
 from runtime.config_models import RunConfig
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_CONFIG_CACHE_MAX = 32
+_CONFIG_CACHE: "OrderedDict[Tuple[str, int, int], RunConfig]" = OrderedDict()
+_CONFIG_CACHE_LOCK = threading.Lock()
+
 
 def default_run_config_dict() -> Dict[str, Any]:
     """Return the canonical nested defaults for all run config sections."""
@@ -37,6 +44,7 @@ def default_run_config_dict() -> Dict[str, Any]:
             "max_invalid_submit_attempts": 3,
             "agent_architecture_override": None,
             "tool_quality_enabled": True,
+            "payload_size_telemetry": True,
             "tool_quality_weights": {
                 "execution_quality": 0.45,
                 "policy_quality": 0.25,
@@ -50,13 +58,21 @@ def default_run_config_dict() -> Dict[str, Any]:
     }
 
 
+_RUN_CONFIG_VALIDATOR = RunConfig.__pydantic_validator__
+_DEFAULT_RUN_CONFIG_DICT = default_run_config_dict()
+_DEFAULT_RUN_CONFIG: RunConfig = _RUN_CONFIG_VALIDATOR.validate_python(_DEFAULT_RUN_CONFIG_DICT)
+
+
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """Merge nested config values while preserving default sections."""
 
-    merged = deepcopy(base)
+    # Only dicts on the merge path are rebuilt; untouched leaves are shared with the inputs,
+    # which is safe because the result is only handed to model validation (which copies).
+    merged = dict(base)
     for key, value in override.items():
-        if isinstance(value, dict) and isinstance(merged.get(key), dict):
-            merged[key] = _deep_merge(merged[key], value)
+        current = merged.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merged[key] = _deep_merge(current, value)
         elif value is not None:
             merged[key] = value
     return merged
@@ -108,7 +124,10 @@ def normalize_run_config(raw_config: Dict[str, Any]) -> RunConfig:
     """Parse and strictly validate runtime config values."""
 
     normalized_dict = normalize_run_config_dict(raw_config)
-    config = RunConfig.model_validate(normalized_dict)
+    if normalized_dict == _DEFAULT_RUN_CONFIG_DICT:
+        # Defaults were validated once at import; skip re-walking the schema.
+        return _DEFAULT_RUN_CONFIG.model_copy(deep=True)
+    config: RunConfig = _RUN_CONFIG_VALIDATOR.validate_python(normalized_dict)
     config.runtime.mode = _validate_mode(config.runtime.mode)
     config.runtime.agent_architecture_override = _validate_agent_architecture_override(
         config.runtime.agent_architecture_override
@@ -119,16 +138,33 @@ def normalize_run_config(raw_config: Dict[str, Any]) -> RunConfig:
 def load_run_config(run_config_path: Path) -> RunConfig:
     """Load and validate a run config YAML file from disk."""
 
-    if not run_config_path.exists():
+    try:
+        stat = run_config_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(
             "Missing run config: "
             f"{run_config_path}. Create one from `profiles/runs/example.swebench_verified.hf.yaml`."
-        )
-    with run_config_path.open("r", encoding="utf-8") as config_file:
-        raw_config = yaml.safe_load(config_file) or {}
+        ) from None
+    key = (str(run_config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            _CONFIG_CACHE.move_to_end(key)
+    if cached is not None:
+        return cached.model_copy(deep=True)
+
+    data = run_config_path.read_bytes()
+    # Blank files skip parser setup entirely; the section check below still rejects them.
+    raw_config = (yaml.load(data, Loader=_YamlLoader) or {}) if data.strip() else {}
     if not isinstance(raw_config, dict):
         raise ValueError(f"Invalid run config shape in {run_config_path}: expected object at root")
-    return normalize_run_config(raw_config)
+    config = normalize_run_config(raw_config)
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[key] = config
+        _CONFIG_CACHE.move_to_end(key)
+        while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.popitem(last=False)
+    return config.model_copy(deep=True)
 
 
 def apply_run_overrides(
@@ -141,13 +177,20 @@ def apply_run_overrides(
 ) -> RunConfig:
     """Apply CLI overrides after strict config parsing."""
 
-    effective = config.model_copy(deep=True)
+    # Copy only the sections that change; untouched sections are shared with `config`.
+    effective = config.model_copy()
+    benchmark_updates: Dict[str, Any] = {}
     if benchmark:
-        effective.benchmark.name = benchmark
+        benchmark_updates["name"] = benchmark
     if split:
-        effective.benchmark.split = split
+        benchmark_updates["split"] = split
+    if benchmark_updates:
+        effective.benchmark = config.benchmark.model_copy(update=benchmark_updates)
+    runtime_updates: Dict[str, Any] = {}
     if selector is not None:
-        effective.runtime.selector = selector
+        runtime_updates["selector"] = selector
     if mode:
-        effective.runtime.mode = _validate_mode(mode)
+        runtime_updates["mode"] = _validate_mode(mode)
+    if runtime_updates:
+        effective.runtime = config.runtime.model_copy(update=runtime_updates)
     return effective
@@ -29,6 +29,14 @@ class EvaluationConfig(BaseModel):
     params: Dict[str, Any] = Field(default_factory=dict)
 
 
+_TOOL_QUALITY_WEIGHT_KEYS = (
+    "execution_quality",
+    "policy_quality",
+    "termination_quality",
+    "budget_quality",
+)
+
+
 class ToolQualityWeights(BaseModel):
     """Weighted components for generic tool-quality scoring."""
 
@@ -43,19 +51,18 @@ class ToolQualityWeights(BaseModel):
     def validate_bounds_and_total(self) -> "ToolQualityWeights":
         """Require non-negative unit-bounded weights with sum approximately 1.0."""
 
-        keys = (
-            "execution_quality",
-            "policy_quality",
-            "termination_quality",
-            "budget_quality",
+        values = (
+            self.execution_quality,
+            self.policy_quality,
+            self.termination_quality,
+            self.budget_quality,
         )
-        total = 0.0
-        for key in keys:
-            value = float(getattr(self, key))
-            if value < 0.0 or value > 1.0:
-                raise ValueError(f"runtime.tool_quality_weights.{key} must be within [0, 1]")
-            total += value
-        if abs(total - 1.0) > 1e-9:
+        if min(values) < 0.0 or max(values) > 1.0:
+            for key in _TOOL_QUALITY_WEIGHT_KEYS:
+                value = getattr(self, key)
+                if value < 0.0 or value > 1.0:
+                    raise ValueError(f"runtime.tool_quality_weights.{key} must be within [0, 1]")
+        if abs(sum(values) - 1.0) > 1e-9:
             raise ValueError("runtime.tool_quality_weights must sum to 1.0")
         return self
 
@@ -73,6 +80,7 @@ class RuntimeConfig(BaseModel):
     max_invalid_submit_attempts: int = Field(default=3, ge=1)
     agent_architecture_override: Optional[str] = None
     tool_quality_enabled: bool = True
+    payload_size_telemetry: bool = True
     tool_quality_weights: ToolQualityWeights = Field(default_factory=ToolQualityWeights)
 
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from benchmarks.registry import BenchmarkRegistry
+from runtime import json_codec
 from runtime.config_loader import apply_run_overrides
 from runtime.config_models import RunConfig
 from runtime.manifest_store import manifest_path, now_iso, read_manifest, write_manifest
@@ -35,6 +36,13 @@ def is_valid_run_id(value: str) -> bool:
     return bool(text and text not in {".", ".."})
 
 
+@lru_cache(maxsize=1)
+def _registry_from(factory: Callable[[], BenchmarkRegistry]) -> BenchmarkRegistry:
+    """Build the benchmark registry once per factory (a patched factory gets its own)."""
+
+    return factory()
+
+
 def derive_run_id_from_predictions(predictions_path: Path, artifacts_dir: Path) -> str:
     """Derive run id strictly from canonical predictions path layout."""
 
@@ -67,11 +75,11 @@ def read_prediction_identity(predictions_path: Path) -> Tuple[Optional[str], Opt
     if not predictions_path.exists():
         return None, None
     try:
-        with predictions_path.open("r", encoding="utf-8") as f:
+        with predictions_path.open("rb") as f:
             for line in f:
                 if not line.strip():
                     continue
-                rec = json.loads(line)
+                rec = json_codec.loads(line)
                 model_name = rec.get("model_name") if isinstance(rec, dict) else None
                 model_name_or_path = rec.get("model_name_or_path") if isinstance(rec, dict) else None
                 return (
@@ -126,9 +134,9 @@ def execute_eval(
         if isinstance(existing_split, str) and existing_split
         else effective_config.benchmark.split
     )
-    effective_config.benchmark.split = split_name
+    effective_config = apply_run_overrides(effective_config, split=split_name)
 
-    adapter_cls = BenchmarkRegistry().get_adapter(benchmark_name)
+    adapter_cls = _registry_from(BenchmarkRegistry).get_adapter(benchmark_name)
     adapter = adapter_cls.from_config(effective_config)
     evaluator = adapter.get_evaluator(effective_config)
 
@@ -170,7 +178,7 @@ def execute_eval(
                 "harness_log_root": str(harness_log_root) if harness_log_root else None,
                 "metrics": metrics,
             },
-            "config_snapshot": effective_config.model_dump(mode="python"),
+            "config_snapshot": effective_config.model_dump(mode="json"),
         }
     )
     write_manifest(out_manifest_path, manifest)
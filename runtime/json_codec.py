@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when the optional wheel is absent
+    orjson = None  # type: ignore[assignment]
+
+
+JSONInput = Union[bytes, bytearray, str]
+
+# orjson turns integers outside the 64-bit range into floats; such documents go to the stdlib.
+_WIDE_INT_TEXT_RE = re.compile(r"\d{19,}")
+_WIDE_INT_BYTES_RE = re.compile(rb"\d{19,}")
+
+
+def _may_hold_wide_int(data: JSONInput) -> bool:
+    """Return whether `data` has a digit run long enough to overflow orjson's 64-bit integers."""
+
+    pattern = _WIDE_INT_TEXT_RE if isinstance(data, str) else _WIDE_INT_BYTES_RE
+    return pattern.search(data) is not None
+
+
+def loads(data: JSONInput) -> Any:
+    """Decode one JSON document from UTF-8 bytes or text, preferring orjson when installed."""
+
+    if orjson is not None and not _may_hold_wide_int(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The stdlib also accepts NaN/Infinity and is the one that reports real errors.
+            pass
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    *,
+    default: Optional[Callable[[Any], Any]] = None,
+    sort_keys: bool = False,
+    indent: bool = False,
+) -> bytes:
+    """Encode one JSON document as UTF-8 bytes (compact, or 2-space indented), preferring orjson."""
+
+    if orjson is not None:
+        # Non-string keys are stringified like the stdlib encoder does; datetimes and dataclasses
+        # go through `default` (or fail) as they would with the stdlib.
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encodes them or raises the same TypeError.
+            pass
+    options: Dict[str, Any] = {
+        "indent": 2 if indent else None,
+        "separators": (",", ": ") if indent else (",", ":"),
+        "default": default,
+        "sort_keys": sort_keys,
+    }
+    try:
+        return json.dumps(obj, ensure_ascii=False, **options).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates have no UTF-8 form; `\uXXXX` escapes keep them, as plain json.dumps did.
+        return json.dumps(obj, ensure_ascii=True, **options).encode("ascii")
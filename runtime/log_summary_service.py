@@ -8,7 +8,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from runtime.manifest_store import append_log, manifest_path, now_iso, read_manifest, write_manifest
+from runtime.manifest_store import (
+    append_log,
+    flush_logs,
+    manifest_path,
+    now_iso,
+    read_manifest,
+    write_manifest,
+)
 
 LOG_LINE_SPLIT = " | "
 LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -432,6 +439,7 @@ def _append_summary_block_to_run_log(
         run_log_path,
         f"{POST_RUN_SUMMARY_BLOCK_BEGIN} version=v1",
         source="log_summary_service.py",
+        flush=False,
     )
     for index, line in enumerate(terminal_lines, start=1):
         normalized_text = (line or "").replace("\r", " ").replace("\n", " ")
@@ -439,12 +447,14 @@ def _append_summary_block_to_run_log(
             run_log_path,
             f"{POST_RUN_SUMMARY_BLOCK_LINE} index={index} text={normalized_text}",
             source="log_summary_service.py",
+            flush=False,
         )
     append_log(
         run_log_path,
         f"{POST_RUN_SUMMARY_BLOCK_END} version=v1 status={status}",
         source="log_summary_service.py",
     )
+    flush_logs(run_log_path)
 
 
 def execute_run_log_summary(*, run_log_path: Path) -> RunLogSummaryOutcome:
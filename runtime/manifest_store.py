@@ -1,10 +1,22 @@
 from __future__ import annotations
 
-import inspect
-import json
+import atexit
+import sys
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+from runtime import json_codec
+
+# (epoch second, formatted string) of the last human timestamp; swapped as one tuple.
+_last_human_stamp: Tuple[int, str] = (-1, "")
+
+# Open append handles for run logs, keyed by path; closed by flush_logs() or at exit.
+_LOG_HANDLES: Dict[str, TextIO] = {}
+_LOG_HANDLES_LOCK = threading.Lock()
 
 
 def new_run_id() -> str:
@@ -22,7 +34,14 @@ def now_iso() -> str:
 def now_human() -> str:
     """Return local timestamp in a compact log-friendly format."""
 
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _last_human_stamp
+    sec = int(time.time())
+    cached_sec, cached_text = _last_human_stamp
+    if sec == cached_sec:
+        return cached_text
+    text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+    _last_human_stamp = (sec, text)
+    return text
 
 
 def manifest_path(run_root: Path) -> Path:
@@ -37,7 +56,7 @@ def read_manifest(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = json_codec.loads(path.read_bytes())
     except Exception:
         return {}
     if isinstance(payload, dict):
@@ -49,20 +68,61 @@ def write_manifest(path: Path, payload: Dict[str, Any]) -> None:
     """Write manifest JSON and fail fast on non-serializable values."""
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    path.write_bytes(json_codec.dumps(payload, indent=True) + b"\n")
+
+
+@lru_cache(maxsize=512)
+def _source_file_name(co_filename: str) -> str:
+    """Memoize the basename of a code object's filename."""
+
+    return Path(co_filename).name
 
 
 def _infer_log_source() -> str:
     """Best-effort caller source in file:line format."""
 
-    frame = inspect.currentframe()
     try:
-        caller = frame.f_back.f_back if frame and frame.f_back else None
-        if caller is None:
-            return "unknown:0"
-        return f"{Path(caller.f_code.co_filename).name}:{caller.f_lineno}"
+        caller = sys._getframe(2)
+    except ValueError:
+        return "unknown:0"
+    try:
+        return f"{_source_file_name(caller.f_code.co_filename)}:{caller.f_lineno}"
     finally:
-        del frame
+        del caller
+
+
+def _get_log_writer(path: Path) -> TextIO:
+    """Return the shared append handle for a log file, opening it on first use."""
+
+    key = str(path)
+    handle = _LOG_HANDLES.get(key)
+    if handle is not None:
+        return handle
+    with _LOG_HANDLES_LOCK:
+        handle = _LOG_HANDLES.get(key)
+        if handle is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Model output may carry lone surrogates; escape them rather than abort the run.
+            handle = path.open("a", encoding="utf-8", errors="backslashreplace", buffering=8192)
+            _LOG_HANDLES[key] = handle
+    return handle
+
+
+def flush_logs(path: Optional[Path] = None) -> None:
+    """Drain and close open log handles (one path, or all of them)."""
+
+    with _LOG_HANDLES_LOCK:
+        if path is None:
+            handles = list(_LOG_HANDLES.values())
+            _LOG_HANDLES.clear()
+        else:
+            handle = _LOG_HANDLES.pop(str(path), None)
+            handles = [handle] if handle is not None else []
+    for handle in handles:
+        handle.close()
+
+
+atexit.register(flush_logs)
 
 
 def append_log(
@@ -71,12 +131,14 @@ def append_log(
     *,
     level: str = "INFO",
     source: Optional[str] = None,
+    flush: bool = True,
 ) -> None:
-    """Append one formatted line to the run log."""
+    """Append one formatted line to the run log; pass flush=False to batch a burst of lines."""
 
-    path.parent.mkdir(parents=True, exist_ok=True)
     normalized_level = (level or "INFO").upper()
     normalized_source = source or _infer_log_source()
-    line = f"{now_human()} | {normalized_level:<8} | {normalized_source:<24} | {message}"
-    with path.open("a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    line = f"{now_human()} | {normalized_level:<8} | {normalized_source:<24} | {message}\n"
+    handle = _get_log_writer(path)
+    handle.write(line)
+    if flush:
+        handle.flush()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+import ijson
+
 
 EVAL_COUNT_KEYS = (
     "total_instances",
@@ -15,10 +17,16 @@ EVAL_COUNT_KEYS = (
     "error_instances",
 )
 
+_EVAL_COUNT_KEY_SET = frozenset(EVAL_COUNT_KEYS)
+_CONTAINER_EVENTS = frozenset(("start_map", "end_map", "start_array", "end_array", "map_key"))
+
 
 def _to_int(value: Any) -> int:
     """Convert metric-like values to non-negative integers."""
 
+    if type(value) is int:
+        # Harness reports store plain ints; skip the isinstance ladder for them.
+        return value if value > 0 else 0
     if isinstance(value, bool):
         return int(value)
     if isinstance(value, int):
@@ -41,40 +49,69 @@ def _safe_div(numerator: int, denominator: int) -> float:
     return float(numerator) / float(denominator)
 
 
+_ZERO_EVAL_METRICS: Dict[str, Any] = {
+    "total_instances": 0,
+    "submitted_instances": 0,
+    "completed_instances": 0,
+    "resolved_instances": 0,
+    "unresolved_instances": 0,
+    "empty_patch_instances": 0,
+    "error_instances": 0,
+    "accuracy_resolved_submitted": 0.0,
+    "accuracy_resolved_completed": 0.0,
+    "completion_rate_submitted": 0.0,
+}
+
+
 def zero_eval_metrics() -> Dict[str, Any]:
     """Return zeroed metrics payload used when report parsing fails."""
 
-    return {
-        "total_instances": 0,
-        "submitted_instances": 0,
-        "completed_instances": 0,
-        "resolved_instances": 0,
-        "unresolved_instances": 0,
-        "empty_patch_instances": 0,
-        "error_instances": 0,
-        "accuracy_resolved_submitted": 0.0,
-        "accuracy_resolved_completed": 0.0,
-        "completion_rate_submitted": 0.0,
-    }
+    return _ZERO_EVAL_METRICS.copy()
+
+
+@lru_cache(maxsize=256)
+def _report_counts(path_text: str, mtime_ns: int, size: int) -> Optional[Tuple[int, ...]]:
+    """Stream top-level report counts once per file version; None marks a non-object report."""
+
+    # Read/parse errors propagate so that transient failures are never cached.
+    found: Dict[str, Any] = {}
+    is_object = False
+    with open(path_text, "rb") as report_file:
+        events = ijson.parse(report_file, use_float=True)
+        for _prefix, event, _value in events:
+            is_object = event == "start_map"
+            break
+        # Drain the whole stream so truncated or corrupt reports still fail to parse.
+        for prefix, event, value in events:
+            # Top-level scalars carry their key as prefix; nested values never match a count key.
+            if prefix in _EVAL_COUNT_KEY_SET and event not in _CONTAINER_EVENTS:
+                # Last occurrence wins for duplicate keys, as with `json.loads`.
+                found[prefix] = value
+    if not is_object:
+        return None
+    return tuple(_to_int(found.get(key)) for key in EVAL_COUNT_KEYS)
 
 
 def read_eval_metrics(report_path: Optional[Path]) -> Tuple[Dict[str, Any], Optional[str]]:
     """Parse harness report JSON and compute derived accuracy/completion rates."""
 
     metrics = zero_eval_metrics()
-    if report_path is None or not report_path.exists():
+    if report_path is None:
+        return metrics, "report_not_found"
+    try:
+        stat = report_path.stat()
+    except OSError:
         return metrics, "report_not_found"
 
     try:
-        payload = json.loads(report_path.read_text(encoding="utf-8"))
+        counts = _report_counts(str(report_path), stat.st_mtime_ns, stat.st_size)
     except Exception:
         return metrics, "report_parse_failed"
 
-    if not isinstance(payload, dict):
+    if counts is None:
         return metrics, "report_invalid_shape"
 
-    for key in EVAL_COUNT_KEYS:
-        metrics[key] = _to_int(payload.get(key))
+    metrics.update(zip(EVAL_COUNT_KEYS, counts))
 
     resolved = metrics["resolved_instances"]
     submitted = metrics["submitted_instances"]
@@ -1,12 +1,15 @@
 import json
 import os
 import random
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
 
 import httpx
 
+from runtime import json_codec
+
 
 @dataclass
 class ToolCall:
@@ -39,6 +42,11 @@ class ModelBackend:
     ) -> GenerationResult:
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Release any transport resources held by the backend."""
+
+        return None
+
 
 class OpenRouterBackend(ModelBackend):
     """OpenAI-compatible backend targeting OpenRouter endpoints with retries."""
@@ -52,6 +60,10 @@ class OpenRouterBackend(ModelBackend):
         "try again",
     )
 
+    # Circuit breaker state shared by every backend instance, keyed by endpoint base URL.
+    _BREAKERS: Dict[str, Dict[str, float]] = {}
+    _BREAKER_LOCK = threading.Lock()
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -62,6 +74,8 @@ class OpenRouterBackend(ModelBackend):
         max_backoff_s: float = 10.0,
         event_logger: Optional[Callable[[str], None]] = None,
         full_log_previews: bool = False,
+        breaker_failure_threshold: int = 5,
+        breaker_open_s: float = 30.0,
     ) -> None:
         """Initialize backend with strict model requirements and retry policy."""
 
@@ -80,6 +94,36 @@ class OpenRouterBackend(ModelBackend):
         self.max_backoff_s = max(0.0, float(max_backoff_s))
         self.event_logger = event_logger
         self.full_log_previews = bool(full_log_previews)
+        self.breaker_failure_threshold = max(1, int(breaker_failure_threshold))
+        self.breaker_open_s = max(0.0, float(breaker_open_s))
+        self._client: Optional[httpx.Client] = None
+
+    def __enter__(self) -> "OpenRouterBackend":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP client; a later generate call opens a fresh one."""
+
+        client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def _http_client(self) -> httpx.Client:
+        """Return the keep-alive client shared by every generate call on this backend."""
+
+        if self._client is None:
+            self._client = httpx.Client(
+                timeout=httpx.Timeout(60.0),
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._client
 
     def generate(
         self,
@@ -98,11 +142,37 @@ class OpenRouterBackend(ModelBackend):
         if decoding:
             payload.update({k: v for k, v in decoding.items() if v is not None})
 
+        self._check_breaker()
+        try:
+            data = self._request_with_retries(payload)
+        except BaseException as exc:
+            # Interrupts and other non-endpoint failures must not leave a half-open probe held.
+            if isinstance(exc, Exception) and self._counts_toward_breaker(exc):
+                self._record_breaker_failure()
+            else:
+                self._release_breaker_probe()
+            raise
+        self._record_breaker_success()
+        return self._parse_generation(data)
+
+    def _request_with_retries(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST the payload with bounded retries and return the decoded response object."""
+
         endpoint = f"{self.base_url}/chat/completions"
-        with httpx.Client(timeout=httpx.Timeout(60.0)) as client:
-            data: Optional[Dict[str, Any]] = None
-            for attempt in range(self.max_retries + 1):
-                attempt_no = attempt + 1
+        client = self._http_client()
+        data: Optional[Dict[str, Any]] = None
+        # The payload is fixed across attempts: encode it once and reuse the bytes for logging.
+        body = json_codec.dumps(payload)
+        log_enabled = bool(self.event_logger)
+        payload_log = ""
+        if log_enabled:
+            preview = self._preview_text(
+                body.decode("utf-8", errors="replace"), limit=self._preview_limit(2000)
+            )
+            payload_log = f" payload_bytes={len(body)} payload_preview={preview}"
+        for attempt in range(self.max_retries + 1):
+            attempt_no = attempt + 1
+            if log_enabled:
                 self._emit_log(
                     "api_request"
                     f" provider=openrouter"
@@ -110,43 +180,39 @@ class OpenRouterBackend(ModelBackend):
                     f" attempt={attempt_no}/{self.max_retries + 1}"
                     f" method=POST"
                     f" url={endpoint}"
-                    f" payload_bytes={self._json_size_bytes(payload)}"
-                    f" payload_preview={self._preview_json(payload, limit=self._preview_limit(2000))}"
+                    f"{payload_log}"
                 )
-                started = time.monotonic()
-                try:
-                    response = client.post(
-                        endpoint,
-                        json=payload,
-                        headers={"Authorization": f"Bearer {self.api_key}"},
-                    )
-                except httpx.RequestError as exc:
-                    latency_ms = int(max(0.0, (time.monotonic() - started) * 1000.0))
-                    self._emit_log(
-                        "api_error"
-                        f" provider=openrouter"
-                        f" model={self.model}"
-                        f" attempt={attempt_no}/{self.max_retries + 1}"
-                        f" kind=request_error"
-                        f" latency_ms={latency_ms}"
-                        f" detail={self._preview_text(str(exc), limit=1200)}"
-                    )
-                    if attempt >= self.max_retries:
-                        raise
-                    wait_s = self._sleep_before_retry(attempt)
-                    self._emit_log(
-                        "api_retry"
-                        f" provider=openrouter"
-                        f" model={self.model}"
-                        f" attempt={attempt_no}/{self.max_retries + 1}"
-                        f" wait_s={wait_s:.2f}"
-                        " reason=request_error"
-                    )
-                    continue
-
+            started = time.monotonic()
+            try:
+                response = client.post(endpoint, content=body)
+            except httpx.RequestError as exc:
                 latency_ms = int(max(0.0, (time.monotonic() - started) * 1000.0))
-                response_text_obj = getattr(response, "text", "")
-                response_text = response_text_obj if isinstance(response_text_obj, str) else str(response_text_obj)
+                self._emit_log(
+                    "api_error"
+                    f" provider=openrouter"
+                    f" model={self.model}"
+                    f" attempt={attempt_no}/{self.max_retries + 1}"
+                    f" kind=request_error"
+                    f" latency_ms={latency_ms}"
+                    f" detail={self._preview_text(str(exc), limit=1200)}"
+                )
+                if attempt >= self.max_retries:
+                    raise
+                wait_s = self._sleep_before_retry(attempt)
+                self._emit_log(
+                    "api_retry"
+                    f" provider=openrouter"
+                    f" model={self.model}"
+                    f" attempt={attempt_no}/{self.max_retries + 1}"
+                    f" wait_s={wait_s:.2f}"
+                    " reason=request_error"
+                )
+                continue
+
+            latency_ms = int(max(0.0, (time.monotonic() - started) * 1000.0))
+            if log_enabled:
+                response_text = self._response_text(response)
+                body_preview = self._preview_text(response_text, limit=self._preview_limit(1200))
                 self._emit_log(
                     "api_response"
                     f" provider=openrouter"
@@ -155,48 +221,12 @@ class OpenRouterBackend(ModelBackend):
                     f" status_code={response.status_code}"
                     f" latency_ms={latency_ms}"
                     f" body_bytes={len(response_text.encode('utf-8', errors='ignore'))}"
-                    f" body_preview={self._preview_text(response_text, limit=self._preview_limit(1200))}"
+                    f" body_preview={body_preview}"
                 )
-                if response.status_code >= 400:
-                    detail = response_text[:2000]
-                    retryable = self._is_retryable_status(response.status_code, detail)
-                    if retryable and attempt < self.max_retries:
-                        wait_s = self._sleep_before_retry(attempt)
-                        self._emit_log(
-                            "api_retry"
-                            f" provider=openrouter"
-                            f" model={self.model}"
-                            f" attempt={attempt_no}/{self.max_retries + 1}"
-                            f" wait_s={wait_s:.2f}"
-                            f" reason=http_{response.status_code}"
-                        )
-                        continue
-
-                    if retryable:
-                        message = (
-                            f"OpenRouter error after {attempt + 1} attempts "
-                            f"({response.status_code}): {detail}"
-                        )
-                    else:
-                        message = f"OpenRouter error {response.status_code}: {detail}"
-                    raise httpx.HTTPStatusError(
-                        message,
-                        request=response.request,
-                        response=response,
-                    )
-
-                try:
-                    parsed = response.json()
-                except json.JSONDecodeError:
-                    self._emit_log(
-                        "api_error"
-                        f" provider=openrouter"
-                        f" model={self.model}"
-                        f" attempt={attempt_no}/{self.max_retries + 1}"
-                        " kind=json_decode_error"
-                    )
-                    if attempt >= self.max_retries:
-                        raise
+            if response.status_code >= 400:
+                detail = self._response_text(response)[:2000]
+                retryable = self._is_retryable_status(response.status_code, detail)
+                if retryable and attempt < self.max_retries:
                     wait_s = self._sleep_before_retry(attempt)
                     self._emit_log(
                         "api_retry"
@@ -204,29 +234,35 @@ class OpenRouterBackend(ModelBackend):
                         f" model={self.model}"
                         f" attempt={attempt_no}/{self.max_retries + 1}"
                         f" wait_s={wait_s:.2f}"
-                        " reason=json_decode_error"
+                        f" reason=http_{response.status_code}"
                     )
                     continue
-                if isinstance(parsed, dict):
-                    data = parsed
-                    self._emit_log(
-                        "api_parsed"
-                        f" provider=openrouter"
-                        f" model={self.model}"
-                        f" attempt={attempt_no}/{self.max_retries + 1}"
-                        " parsed_type=dict"
+
+                if retryable:
+                    message = (
+                        f"OpenRouter error after {attempt + 1} attempts "
+                        f"({response.status_code}): {detail}"
                     )
-                    self._emit_usage_log(data, attempt_no=attempt_no, total_attempts=self.max_retries + 1)
-                    break
-                if attempt >= self.max_retries:
-                    raise ValueError("OpenRouter returned non-dict JSON response")
+                else:
+                    message = f"OpenRouter error {response.status_code}: {detail}"
+                raise httpx.HTTPStatusError(
+                    message,
+                    request=response.request,
+                    response=response,
+                )
+
+            try:
+                parsed = json_codec.loads(response.content)
+            except json.JSONDecodeError:
                 self._emit_log(
                     "api_error"
                     f" provider=openrouter"
                     f" model={self.model}"
                     f" attempt={attempt_no}/{self.max_retries + 1}"
-                    " kind=non_dict_response"
+                    " kind=json_decode_error"
                 )
+                if attempt >= self.max_retries:
+                    raise
                 wait_s = self._sleep_before_retry(attempt)
                 self._emit_log(
                     "api_retry"
@@ -234,11 +270,45 @@ class OpenRouterBackend(ModelBackend):
                     f" model={self.model}"
                     f" attempt={attempt_no}/{self.max_retries + 1}"
                     f" wait_s={wait_s:.2f}"
-                    " reason=non_dict_response"
+                    " reason=json_decode_error"
                 )
-
-            if data is None:
-                raise RuntimeError("OpenRouter request exhausted retries without a valid response")
+                continue
+            if isinstance(parsed, dict):
+                data = parsed
+                self._emit_log(
+                    "api_parsed"
+                    f" provider=openrouter"
+                    f" model={self.model}"
+                    f" attempt={attempt_no}/{self.max_retries + 1}"
+                    " parsed_type=dict"
+                )
+                self._emit_usage_log(data, attempt_no=attempt_no, total_attempts=self.max_retries + 1)
+                break
+            if attempt >= self.max_retries:
+                raise ValueError("OpenRouter returned non-dict JSON response")
+            self._emit_log(
+                "api_error"
+                f" provider=openrouter"
+                f" model={self.model}"
+                f" attempt={attempt_no}/{self.max_retries + 1}"
+                " kind=non_dict_response"
+            )
+            wait_s = self._sleep_before_retry(attempt)
+            self._emit_log(
+                "api_retry"
+                f" provider=openrouter"
+                f" model={self.model}"
+                f" attempt={attempt_no}/{self.max_retries + 1}"
+                f" wait_s={wait_s:.2f}"
+                " reason=non_dict_response"
+            )
+
+        if data is None:
+            raise RuntimeError("OpenRouter request exhausted retries without a valid response")
+        return data
+
+    def _parse_generation(self, data: Dict[str, Any]) -> GenerationResult:
+        """Convert one chat-completions response object into a GenerationResult."""
 
         choice = data.get("choices", [{}])[0]
         message = choice.get("message", {})
@@ -274,6 +344,7 @@ class OpenRouterBackend(ModelBackend):
             args = func.get("arguments")
             if isinstance(args, str):
                 try:
+                    # Stdlib parsing keeps integer arguments exact at any size.
                     args = json.loads(args)
                 except json.JSONDecodeError:
                     self._emit_log(
@@ -315,14 +386,81 @@ class OpenRouterBackend(ModelBackend):
         return any(marker in lowered for marker in cls._RETRYABLE_400_MARKERS)
 
     @staticmethod
-    def _json_size_bytes(payload: Any) -> int:
-        """Approximate payload size as UTF-8 JSON bytes for logging."""
-
-        try:
-            serialized = json.dumps(payload, default=str, ensure_ascii=False)
-        except Exception:
-            serialized = str(payload)
-        return len(serialized.encode("utf-8", errors="ignore"))
+    def _response_text(response: Any) -> str:
+        """Decode the response body as text; only logging and error paths need it."""
+
+        text = getattr(response, "text", "")
+        return text if isinstance(text, str) else str(text)
+
+    def _check_breaker(self) -> None:
+        """Fail fast while the endpoint's breaker is open; let one probe through afterwards."""
+
+        with self._BREAKER_LOCK:
+            state = self._BREAKERS.get(self.base_url)
+            if state is None or not state["opened_at"]:
+                return
+            open_for = time.monotonic() - state["opened_at"]
+            probing = bool(state.get("probing"))
+            if open_for >= self.breaker_open_s and not probing:
+                # Half-open: only this caller goes through; its outcome closes or re-opens.
+                state["probing"] = 1.0
+                return
+        if probing:
+            detail = "half-open probe in flight"
+        else:
+            detail = f"{self.breaker_open_s - open_for:.1f}s remaining"
+        raise RuntimeError(f"circuit_open: OpenRouter breaker open for {self.base_url} ({detail})")
+
+    def _counts_toward_breaker(self, exc: Exception) -> bool:
+        """Only exhausted transient failures signal an outage; caller errors do not."""
+
+        if isinstance(exc, httpx.HTTPStatusError):
+            response = exc.response
+            detail = getattr(response, "text", "") or ""
+            return self._is_retryable_status(response.status_code, str(detail)[:2000])
+        return True
+
+    def _record_breaker_failure(self) -> None:
+        """Count one failed generate call and open the breaker at the threshold."""
+
+        with self._BREAKER_LOCK:
+            state = self._BREAKERS.setdefault(
+                self.base_url, {"failures": 0, "opened_at": 0.0, "probing": 0.0}
+            )
+            state["failures"] += 1
+            state["probing"] = 0.0
+            opened = state["failures"] >= self.breaker_failure_threshold
+            if opened:
+                state["opened_at"] = time.monotonic()
+            failures = int(state["failures"])
+        if opened:
+            self._emit_log(
+                "api_breaker_open"
+                f" provider=openrouter"
+                f" model={self.model}"
+                f" failures={failures}"
+                f" open_s={self.breaker_open_s:.1f}"
+            )
+
+    def _release_breaker_probe(self) -> None:
+        """Let another caller probe after one that failed for reasons unrelated to the endpoint."""
+
+        with self._BREAKER_LOCK:
+            state = self._BREAKERS.get(self.base_url)
+            if state is not None:
+                state["probing"] = 0.0
+
+    def _record_breaker_success(self) -> None:
+        """Reset the failure count after a successful call."""
+
+        with self._BREAKER_LOCK:
+            state = self._BREAKERS.pop(self.base_url, None)
+        if state is not None and state["failures"] >= self.breaker_failure_threshold:
+            self._emit_log(
+                "api_breaker_close"
+                f" provider=openrouter"
+                f" model={self.model}"
+            )
 
     @staticmethod
     def _preview_text(text: str, limit: Optional[int] = 2000) -> str:
@@ -333,15 +471,6 @@ class OpenRouterBackend(ModelBackend):
             return compact
         return compact[:limit] + "...[truncated]"
 
-    def _preview_json(self, payload: Dict[str, Any], limit: Optional[int] = 2000) -> str:
-        """Serialize payloads safely for run-log diagnostics."""
-
-        try:
-            serialized = json.dumps(payload, ensure_ascii=False)
-        except Exception:
-            serialized = str(payload)
-        return self._preview_text(serialized, limit=limit)
-
     def _preview_limit(self, default_limit: int) -> Optional[int]:
         """Return preview truncation limit, or None when full previews are enabled."""
 
@@ -403,14 +532,13 @@ class OpenRouterBackend(ModelBackend):
         self._emit_log(" ".join(fields))
 
     def _sleep_before_retry(self, attempt: int) -> float:
-        """Sleep using bounded exponential backoff with jitter and return wait seconds."""
+        """Sleep a full-jitter backoff within the capped exponential and return wait seconds."""
 
-        base = self.initial_backoff_s * (2**attempt)
-        wait_s = min(self.max_backoff_s, base)
-        if wait_s <= 0:
+        cap = min(self.max_backoff_s, self.initial_backoff_s * (2**attempt))
+        if cap <= 0:
             return 0.0
-        jitter_max = min(1.0, wait_s * 0.25)
-        wait_s += random.uniform(0.0, jitter_max)
+        # Full jitter spreads concurrent workers' retries instead of moving them in lockstep.
+        wait_s = random.uniform(0.0, cap)
         time.sleep(wait_s)
         return wait_s
 
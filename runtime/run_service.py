@@ -10,10 +10,18 @@ from agent_architectures.base import ArchitectureRunRequest
 from agent_architectures.factory import get_agent_architecture, resolve_agent_architecture
 from agents.spec_loader import AgentSpecLoader
 from benchmarks.registry import BenchmarkRegistry
+from runtime import json_codec
 from runtime.artifact_policy import apply_artifact_policy
 from runtime.config_loader import apply_run_overrides
 from runtime.config_models import RunConfig
-from runtime.manifest_store import append_log, manifest_path, new_run_id, now_iso, write_manifest
+from runtime.manifest_store import (
+    append_log,
+    flush_logs,
+    manifest_path,
+    new_run_id,
+    now_iso,
+    write_manifest,
+)
 from runtime.metrics import zero_eval_metrics
 from runtime.prompt_messages import build_initial_user_message
 from runtime.tool_quality import (
@@ -179,7 +187,7 @@ def execute_run(
         if isinstance(raw_termination_tool, str) and raw_termination_tool.strip():
             termination_tool = raw_termination_tool.strip()
 
-    with out_path.open("w", encoding="utf-8") as out_file, telemetry_path.open(
+    with out_path.open("wb") as out_file, telemetry_path.open(
         "w",
         encoding="utf-8",
     ) as telemetry_file:
@@ -274,6 +282,7 @@ def execute_run(
                         full_log_previews=full_log_previews,
                         api_log=_api_log,
                         architecture_config=spec.agent_architecture_config,
+                        payload_size_telemetry=effective_config.runtime.payload_size_telemetry,
                     )
                 )
                 # Explicit submit tool payload takes precedence over assistant free text.
@@ -356,7 +365,7 @@ def execute_run(
                     model_name=spec.name,
                     metadata=result.metadata,
                 )
-                out_file.write(json.dumps(record) + "\n")
+                out_file.write(json_codec.dumps(record) + b"\n")
                 out_file.flush()
 
                 per_task_line = (
@@ -462,7 +471,7 @@ def execute_run(
             "harness_log_root": None,
             "metrics": zero_eval_metrics(),
         },
-        "config_snapshot": effective_config.model_dump(mode="python"),
+        "config_snapshot": effective_config.model_dump(mode="json"),
     }
     out_manifest_path = manifest_path(run_root)
     write_manifest(out_manifest_path, manifest_payload)
@@ -477,6 +486,7 @@ def execute_run(
         append_log(run_log_path, f"Mini trace written to {mini_trace_path}")
     append_log(run_log_path, f"Manifest written to {out_manifest_path}")
     append_log(run_log_path, f"Run log written to {run_log_path}")
+    flush_logs(run_log_path)
 
     return RunOutcome(
         run_id=run_id,
@@ -625,3 +625,91 @@ def test_agent_runtime_serializes_and_truncates_tool_results_in_tool_messages():
     assert content.startswith("{")
     assert '"content"' in content
     assert "...[truncated]" in content
+
+
+def test_agent_runtime_skips_payload_sizes_when_disabled():
+    backend = _SequenceBackend(
+        [
+            GenerationResult(
+                assistant_text="",
+                tool_calls=[ToolCall(name="workspace_list", arguments={"path": "."})],
+            ),
+        ]
+    )
+    registry = _ToolRegistryStub({"workspace_list": {"entries": ["a.py"]}})
+    runtime = AgentRuntime(
+        backend=backend,
+        tool_registry=registry,
+        allowed_tools={"workspace_list"},
+        max_tool_calls=1,
+        max_wall_time_s=10,
+        termination_tool="submit",
+        mode_name="tools_enabled",
+        measure_payload_sizes=False,
+    )
+
+    result = runtime.run(task=_task(), system_prompt="prompt", initial_user_message="Fix the bug", tool_schemas=[], decoding_defaults=None)
+    events = result.metadata["tool_quality_runtime"]["events"]
+
+    assert len(events) == 1
+    assert events[0]["executed"] is True
+    assert events[0]["args_size_bytes"] == 0
+    assert events[0]["result_size_bytes"] == 0
+
+
+def test_agent_runtime_reuses_encoded_arguments_for_message_and_size():
+    backend = _CapturingSequenceBackend(
+        [
+            GenerationResult(
+                assistant_text="",
+                tool_calls=[ToolCall(name="workspace_list", arguments={"path": "é"})],
+            ),
+            GenerationResult(assistant_text="done", tool_calls=[]),
+        ]
+    )
+    registry = _ToolRegistryStub({"workspace_list": {"entries": []}})
+    runtime = AgentRuntime(
+        backend=backend,
+        tool_registry=registry,
+        allowed_tools={"workspace_list"},
+        max_tool_calls=5,
+        max_wall_time_s=10,
+        termination_tool="submit",
+        mode_name="patch_only",
+    )
+
+    result = runtime.run(task=_task(), system_prompt="prompt", initial_user_message="Fix the bug", tool_schemas=[], decoding_defaults=None)
+    assistant_msg = backend.calls[1]["messages"][2]
+    event = result.metadata["tool_quality_runtime"]["events"][0]
+
+    assert assistant_msg["tool_calls"][0]["function"]["arguments"] == '{"path":"é"}'
+    assert event["args_size_bytes"] == len('{"path":"é"}'.encode("utf-8"))
+
+
+def test_agent_runtime_encodes_arguments_with_integers_beyond_64_bits():
+    backend = _CapturingSequenceBackend(
+        [
+            GenerationResult(
+                assistant_text="",
+                tool_calls=[ToolCall(name="workspace_list", arguments={"n": 2**70})],
+            ),
+            GenerationResult(assistant_text="done", tool_calls=[]),
+        ]
+    )
+    registry = _ToolRegistryStub({"workspace_list": {"entries": []}})
+    runtime = AgentRuntime(
+        backend=backend,
+        tool_registry=registry,
+        allowed_tools={"workspace_list"},
+        max_tool_calls=5,
+        max_wall_time_s=10,
+        termination_tool="submit",
+        mode_name="patch_only",
+    )
+
+    result = runtime.run(task=_task(), system_prompt="prompt", initial_user_message="Fix the bug", tool_schemas=[], decoding_defaults=None)
+    assistant_msg = backend.calls[1]["messages"][2]
+
+    assert assistant_msg["tool_calls"][0]["function"]["arguments"] == '{"n":1180591620717411303424}'
+    assert registry.calls == ["workspace_list"]
+    assert result.metadata["tool_quality_runtime"]["events"][0]["args_size_bytes"] == 28
@@ -64,3 +64,77 @@ def test_patch_policy_rejects_truncated_patch():
     assert result.valid is False
     assert result.artifact == ""
     assert result.reason == "missing_hunk_header"
+
+
+def test_patch_policy_requires_headers_at_line_start():
+    raw = (
+        "diff --git a/example.py b/example.py\n"
+        "index 1111111..2222222 100644 --- a/example.py\n"
+        "+++ b/example.py\n"
+        "@@ -1 +1 @@\n"
+        "-old\n"
+        "+new\n"
+    )
+    result = apply_artifact_policy(raw, "patch")
+    assert result.valid is False
+    assert result.reason == "missing_old_file_header"
+
+
+def test_patch_policy_requires_closed_hunk_range():
+    raw = (
+        "diff --git a/example.py b/example.py\n"
+        "--- a/example.py\n"
+        "+++ b/example.py\n"
+        "@@ -1 +1\n"
+        "-old\n"
+        "+new\n"
+    )
+    result = apply_artifact_policy(raw, "patch")
+    assert result.valid is False
+    assert result.reason == "missing_hunk_header"
+
+
+def test_patch_policy_keeps_form_feed_inside_patch_lines():
+    patch = (
+        "diff --git a/example.py b/example.py\n"
+        "--- a/example.py\n"
+        "+++ b/example.py\n"
+        "@@ -1,2 +1,2 @@\n"
+        " x = 1\f# section\n"
+        "-old\n"
+        "+new\n"
+    )
+    result = apply_artifact_policy(patch + "\nThat should fix it.\n", "patch")
+    assert result.valid is True
+    assert result.artifact == patch
+
+
+def test_json_policy_canonicalizes_with_sorted_compact_keys():
+    result = apply_artifact_policy('{\r\n  "b": [1, 2],\r\n  "a": {"z": "\u00e9", "y": null}\r\n}', "json")
+    assert result.valid is True
+    assert result.artifact == '{"a":{"y":null,"z":"é"},"b":[1,2]}'
+
+
+def test_json_policy_keeps_non_finite_floats():
+    result = apply_artifact_policy('{"b": [NaN, -Infinity], "a": 1e400}', "json")
+    assert result.valid is True
+    assert result.artifact == '{"a":Infinity,"b":[NaN,-Infinity]}'
+
+
+def test_json_policy_escapes_lone_surrogates():
+    result = apply_artifact_policy('["\\ud83d", "\u00e9"]', "json")
+    assert result.valid is True
+    assert result.artifact == '["\\ud83d","\\u00e9"]'
+
+
+def test_json_policy_rejects_invalid_json():
+    result = apply_artifact_policy("{not json", "json")
+    assert result.valid is False
+    assert result.reason == "invalid_json"
+    assert result.artifact == "{not json"
+
+
+def test_policy_dispatch_normalizes_output_type_case_and_whitespace():
+    result = apply_artifact_policy(' {"a": 1} ', " JSON ")
+    assert result.valid is True
+    assert result.artifact == '{"a":1}'
@@ -56,6 +56,14 @@ def test_discovery_finds_swebench_verified():
     assert "swebench_verified" in discovered
 
 
+def test_discovery_result_is_cached_but_returned_as_fresh_dict():
+    first = discover_benchmark_adapters()
+    first["injected"] = _ValidShapeAdapter
+    second = discover_benchmark_adapters()
+    assert "injected" not in second
+    assert second["swebench_verified"] is first["swebench_verified"]
+
+
 def test_candidate_check_rejects_missing_benchmark_name():
     assert _is_adapter_candidate(_ValidShapeAdapter)
     assert _is_adapter_candidate(_MissingNameAdapter) is False
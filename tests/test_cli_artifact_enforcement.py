@@ -953,3 +953,34 @@ def test_derive_run_id_rejects_non_canonical_layout(tmp_path: Path):
     p.write_text("", encoding="utf-8")
     with pytest.raises(ValueError):
         eval_service.derive_run_id_from_predictions(p, artifacts_dir)
+
+
+def test_derive_run_id_follows_retargeted_artifacts_symlink(tmp_path: Path):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    (first / "2026-02-12_165543").mkdir(parents=True)
+    (second / "2026-02-12_165543").mkdir(parents=True)
+    link = tmp_path / "artifacts"
+    link.symlink_to(first)
+    first_predictions = first / "2026-02-12_165543" / "predictions.jsonl"
+
+    assert eval_service.derive_run_id_from_predictions(first_predictions, link) == "2026-02-12_165543"
+
+    link.unlink()
+    link.symlink_to(second)
+    with pytest.raises(ValueError, match="must be under"):
+        eval_service.derive_run_id_from_predictions(first_predictions, link)
+
+
+def test_run_service_writes_prediction_with_lone_surrogate(monkeypatch, tmp_path: Path):
+    patch_with_surrogate = (
+        "diff --git a/example.py b/example.py\n"
+        "index 1111111..2222222 100644\n"
+        "--- a/example.py\n"
+        "+++ b/example.py\n"
+        "@@ -1 +1 @@\n"
+        "-old\n"
+        "+new \ud83d\n"
+    )
+    record, _ = _run_once(monkeypatch, tmp_path, raw_artifact=patch_with_surrogate)
+    assert record["model_patch"] == patch_with_surrogate
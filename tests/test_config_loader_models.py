@@ -36,6 +36,7 @@ def test_normalize_run_config_keeps_params_maps():
     assert cfg.benchmark.params["subset"] == "mini"
     assert cfg.evaluation.params["timeout_s"] == 900
     assert cfg.runtime.tool_quality_enabled is True
+    assert cfg.runtime.payload_size_telemetry is True
     assert cfg.runtime.tool_quality_weights.execution_quality == 0.45
     assert cfg.runtime.tool_quality_weights.policy_quality == 0.25
     assert cfg.runtime.tool_quality_weights.termination_quality == 0.20
@@ -313,3 +314,89 @@ def test_normalize_run_config_rejects_invalid_architecture_override():
                 "output": {"artifacts_dir": "artifacts"},
             }
         )
+
+
+def test_load_run_config_caches_by_file_stat(tmp_path, monkeypatch):
+    import runtime.config_loader as config_loader
+
+    path = tmp_path / "run.yaml"
+    source = sorted(Path("profiles/runs").glob("*.yaml"))[0]
+    path.write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
+    parses = []
+    real_load = config_loader.yaml.load
+    monkeypatch.setattr(
+        config_loader.yaml, "load", lambda *a, **k: parses.append(1) or real_load(*a, **k)
+    )
+
+    first = load_run_config(path)
+    first.runtime.selector = 999
+    second = load_run_config(path)
+    assert len(parses) == 1
+    assert second.runtime.selector != 999
+
+    path.write_text(path.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    load_run_config(path)
+    assert len(parses) == 2
+
+
+def test_load_run_config_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Missing run config"):
+        load_run_config(tmp_path / "absent.yaml")
+
+
+def test_normalize_run_config_dict_does_not_mutate_input():
+    from runtime.config_loader import normalize_run_config_dict
+
+    raw = {
+        "benchmark": {"split": "dev", "params": {"subset": "mini"}},
+        "evaluation": {"workdir": None},
+        "runtime": {"tool_quality_weights": {"budget_quality": 0.2}},
+        "output": {},
+    }
+    merged = normalize_run_config_dict(raw)
+
+    assert merged["benchmark"]["split"] == "dev"
+    assert merged["benchmark"]["params"] == {"subset": "mini"}
+    assert merged["evaluation"]["workdir"] == "."
+    assert merged["runtime"]["tool_quality_weights"]["execution_quality"] == 0.45
+    assert merged["runtime"]["tool_quality_weights"]["budget_quality"] == 0.2
+    assert raw["runtime"]["tool_quality_weights"] == {"budget_quality": 0.2}
+    assert raw["evaluation"] == {"workdir": None}
+
+
+def test_default_run_config_dict_matches_model_defaults():
+    from runtime.config_loader import default_run_config_dict
+    from runtime.config_models import RunConfig
+
+    assert RunConfig().model_dump() == default_run_config_dict()
+
+
+def test_normalize_run_config_defaults_return_independent_copies():
+    sections = {"benchmark": {}, "evaluation": {}, "runtime": {}, "output": {}}
+    first = normalize_run_config(sections)
+    first.benchmark.params["subset"] = "mini"
+    second = normalize_run_config(sections)
+    assert second.benchmark.params == {}
+    assert second.runtime.mode == "patch_only"
+
+
+def test_apply_run_overrides_copies_only_changed_sections():
+    from runtime.config_loader import apply_run_overrides
+
+    base = normalize_run_config({"benchmark": {}, "evaluation": {}, "runtime": {}, "output": {}})
+    effective = apply_run_overrides(base, split="dev", mode="tools_enabled")
+
+    assert effective.benchmark.split == "dev"
+    assert effective.runtime.mode == "tools_enabled"
+    assert base.benchmark.split == "test"
+    assert base.runtime.mode == "patch_only"
+    assert effective.evaluation is base.evaluation
+    with pytest.raises(ValueError):
+        apply_run_overrides(base, mode="A")
+
+
+def test_load_run_config_rejects_blank_file(tmp_path):
+    path = tmp_path / "blank.yaml"
+    path.write_text("  \n", encoding="utf-8")
+    with pytest.raises(ValueError, match="strict nested sections"):
+        load_run_config(path)
@@ -0,0 +1,88 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from runtime import json_codec
+
+_ORJSON = json_codec.orjson
+
+
+@pytest.fixture(autouse=True, params=["orjson", "stdlib"])
+def codec_backend(request, monkeypatch):
+    if request.param == "orjson" and _ORJSON is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_codec, "orjson", _ORJSON if request.param == "orjson" else None)
+    return request.param
+
+
+def test_loads_accepts_bytes_and_text():
+    assert json_codec.loads(b'{"a": [1, "\xc3\xa9"]}') == {"a": [1, "é"]}
+    assert json_codec.loads('{"a": null}') == {"a": None}
+
+
+def test_loads_errors_are_stdlib_decode_errors():
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"{not json")
+
+
+def test_dumps_is_compact_utf8_and_round_trips():
+    record = {"instance_id": "x", "model_patch": "é\n", "n": [1, None]}
+    encoded = json_codec.dumps(record)
+    assert isinstance(encoded, bytes)
+    assert b"\n" not in encoded
+    assert "é".encode("utf-8") in encoded
+    assert json_codec.loads(encoded) == record
+
+
+def test_dumps_applies_default_for_unsupported_types():
+    from pathlib import Path
+
+    assert json_codec.loads(json_codec.dumps({"p": Path("a")}, default=str)) == {"p": "a"}
+    with pytest.raises(TypeError):
+        json_codec.dumps({"p": Path("a")})
+
+
+def test_dumps_sort_keys_orders_nested_objects():
+    assert json_codec.dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True) == b'{"a":{"c":3,"d":2},"b":1}'
+
+
+def test_dumps_indent_matches_stdlib_layout():
+    record = {"run_id": "r", "counts": {"1": 2}, "items": [1, "é"]}
+    expected = json.dumps(record, indent=2, ensure_ascii=False).encode("utf-8")
+    assert json_codec.dumps(record, indent=True) == expected
+
+
+def test_dumps_stringifies_non_string_keys():
+    assert json_codec.loads(json_codec.dumps({1: "a"})) == {"1": "a"}
+
+
+def test_loads_accepts_nan_and_infinity_constants():
+    decoded = json_codec.loads(b'{"x": NaN, "y": Infinity}')
+    assert decoded["x"] != decoded["x"]
+    assert decoded["y"] == float("inf")
+
+
+def test_loads_keeps_integers_beyond_64_bits_exact():
+    assert json_codec.loads(b'{"n": 18446744073709551616}') == {"n": 2**64}
+    assert json_codec.loads('[-9223372036854775809]') == [-(2**63) - 1]
+
+
+def test_dumps_encodes_integers_beyond_64_bits():
+    assert json_codec.dumps({"n": 2**70}) == b'{"n":1180591620717411303424}'
+    assert json_codec.dumps({"n": 2**70}, default=str) == b'{"n":1180591620717411303424}'
+
+
+def test_dumps_routes_datetimes_through_default():
+    stamp = datetime(2026, 1, 2, 3, 4, 5)
+    with pytest.raises(TypeError):
+        json_codec.dumps({"t": stamp})
+    assert json_codec.dumps({"t": stamp}, default=str) == b'{"t":"2026-01-02 03:04:05"}'
+
+
+def test_dumps_escapes_lone_surrogates_and_round_trips():
+    record = {"model_patch": "x\ud83dy", "note": "é"}
+    encoded = json_codec.dumps(record)
+    assert b"\\ud83d" in encoded
+    assert json_codec.loads(encoded) == record
+    assert json_codec.loads(json.dumps(record)) == record
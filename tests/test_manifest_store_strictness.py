@@ -1,13 +1,61 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 import pytest
 
-from runtime.manifest_store import write_manifest
+from runtime.manifest_store import (
+    append_log,
+    flush_logs,
+    now_human,
+    read_manifest,
+    write_manifest,
+)
 
 
 def test_write_manifest_fails_on_non_serializable_payload(tmp_path: Path):
     payload = {"run_id": "2026-02-13_010203", "config_snapshot": {"bad": object()}}
     with pytest.raises(TypeError):
         write_manifest(tmp_path / "manifest.json", payload)
+
+
+def test_manifest_round_trips_as_indented_utf8(tmp_path: Path):
+    path = tmp_path / "run" / "manifest.json"
+    payload = {"run_id": "2026-02-13_010203", "notes": "é", "evaluation": {"status": "ok"}}
+    write_manifest(path, payload)
+
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith('{\n  "run_id": ')
+    assert text.endswith("}\n")
+    assert read_manifest(path) == payload
+    path.write_text("[1, 2]", encoding="utf-8")
+    assert read_manifest(path) == {}
+
+
+def test_append_log_infers_caller_source(tmp_path: Path):
+    log_path = tmp_path / "logs" / "run.log"
+    append_log(log_path, "first")
+    append_log(log_path, "second", level="warning", source="custom:1")
+
+    first, second = log_path.read_text(encoding="utf-8").splitlines()
+    assert re.match(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \| INFO ", first)
+    assert "| test_manifest_store_strictness.py:" in first
+    assert first.endswith("| first")
+    assert "| WARNING  | custom:1 " in second
+    flush_logs(log_path)
+
+
+def test_append_log_batches_until_flush_logs(tmp_path: Path):
+    log_path = tmp_path / "run.log"
+    append_log(log_path, "buffered", flush=False)
+    flush_logs(log_path)
+    append_log(log_path, "reopened", flush=False)
+    flush_logs()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert [line.rsplit("| ", 1)[-1] for line in lines] == ["buffered", "reopened"]
+
+
+def test_now_human_format():
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", now_human())
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from runtime.metrics import EVAL_COUNT_KEYS, read_eval_metrics, zero_eval_metrics
+
+
+def test_read_eval_metrics_coerces_counts_and_derives_rates(tmp_path: Path):
+    report = tmp_path / "report.json"
+    report.write_text(
+        json.dumps(
+            {
+                "total_instances": 10,
+                "submitted_instances": "4",
+                "completed_instances": 2.0,
+                "resolved_instances": 1,
+                "unresolved_instances": -3,
+                "error_instances": True,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    metrics, warning = read_eval_metrics(report)
+
+    assert warning is None
+    assert metrics["total_instances"] == 10
+    assert metrics["submitted_instances"] == 4
+    assert metrics["completed_instances"] == 2
+    assert metrics["unresolved_instances"] == 0
+    assert metrics["empty_patch_instances"] == 0
+    assert metrics["error_instances"] == 1
+    assert metrics["accuracy_resolved_submitted"] == 0.25
+    assert metrics["accuracy_resolved_completed"] == 0.5
+    assert metrics["completion_rate_submitted"] == 0.5
+
+
+def test_read_eval_metrics_reports_missing_and_invalid_files(tmp_path: Path):
+    assert read_eval_metrics(None) == (zero_eval_metrics(), "report_not_found")
+    bad = tmp_path / "bad.json"
+    bad.write_text("{nope", encoding="utf-8")
+    assert read_eval_metrics(bad) == (zero_eval_metrics(), "report_parse_failed")
+    bad.write_text("[]", encoding="utf-8")
+    assert read_eval_metrics(bad) == (zero_eval_metrics(), "report_invalid_shape")
+
+
+def test_zero_eval_metrics_returns_independent_dicts():
+    first = zero_eval_metrics()
+    first["resolved_instances"] = 5
+    assert zero_eval_metrics()["resolved_instances"] == 0
+
+
+def test_read_eval_metrics_reuses_parse_for_unchanged_report(tmp_path: Path, monkeypatch):
+    import runtime.metrics as metrics_module
+
+    report = tmp_path / "report.json"
+    report.write_text(json.dumps({"resolved_instances": 1, "submitted_instances": 2}), "utf-8")
+    parses = []
+    real_parse = metrics_module.ijson.parse
+    monkeypatch.setattr(
+        metrics_module.ijson, "parse", lambda *a, **k: parses.append(1) or real_parse(*a, **k)
+    )
+
+    first, _ = read_eval_metrics(report)
+    first["resolved_instances"] = 99
+    second, _ = read_eval_metrics(report)
+    assert len(parses) == 1
+    assert second["resolved_instances"] == 1
+
+    report.write_text(json.dumps({"resolved_instances": 2, "submitted_instances": 20}), "utf-8")
+    third, _ = read_eval_metrics(report)
+    assert len(parses) == 2
+    assert third["accuracy_resolved_submitted"] == 0.1
+
+
+def test_read_eval_metrics_ignores_nested_keys_and_keeps_last_duplicate(tmp_path: Path):
+    counts = {key: index + 1 for index, key in enumerate(EVAL_COUNT_KEYS)}
+    report = tmp_path / "report.json"
+    report.write_text(
+        '{"details": {"resolved_instances": 500}, "ids": [1.5], "completed_instances": 77,'
+        + json.dumps(counts)[1:-1]
+        + ', "tail": []}',
+        encoding="utf-8",
+    )
+
+    metrics, warning = read_eval_metrics(report)
+
+    assert warning is None
+    assert {key: metrics[key] for key in EVAL_COUNT_KEYS} == counts
+
+
+def test_read_eval_metrics_rejects_truncated_report_after_all_counts(tmp_path: Path):
+    counts = {key: index + 1 for index, key in enumerate(EVAL_COUNT_KEYS)}
+    report = tmp_path / "report.json"
+    report.write_text(json.dumps(counts)[:-1] + ', "tail": [', encoding="utf-8")
+
+    assert read_eval_metrics(report) == (zero_eval_metrics(), "report_parse_failed")
@@ -1,9 +1,18 @@
+import json
+
 import httpx
 import pytest
 
 from runtime.model_backend import OpenRouterBackend
 
 
+@pytest.fixture(autouse=True)
+def _reset_breakers():
+    OpenRouterBackend._BREAKERS.clear()
+    yield
+    OpenRouterBackend._BREAKERS.clear()
+
+
 class _FakeResponse:
     def __init__(self, status_code: int, text: str, payload: dict | None = None):
         self.status_code = status_code
@@ -11,8 +20,9 @@ class _FakeResponse:
         self._payload = payload or {}
         self.request = httpx.Request("POST", "https://openrouter.test/chat/completions")
 
-    def json(self):
-        return self._payload
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
 
 
 def test_retryable_400_then_success(monkeypatch):
@@ -143,6 +153,41 @@ def test_generate_does_not_extract_tool_calls_from_assistant_text(monkeypatch):
     assert result.tool_calls == []
 
 
+def test_generate_keeps_large_integer_tool_arguments_exact(monkeypatch):
+    class _FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def post(self, *args, **kwargs):
+            return _FakeResponse(
+                200,
+                "",
+                payload={
+                    "choices": [
+                        {
+                            "message": {
+                                "content": "",
+                                "tool_calls": [
+                                    {
+                                        "function": {
+                                            "name": "workspace_read",
+                                            "arguments": '{"offset": 18446744073709551617}',
+                                        }
+                                    }
+                                ],
+                            }
+                        }
+                    ]
+                },
+            )
+
+    monkeypatch.setattr("runtime.model_backend.httpx.Client", _FakeClient)
+    backend = OpenRouterBackend(api_key="test-key", model="openrouter/free", max_retries=0)
+    result = backend.generate(messages=[{"role": "user", "content": "task"}])
+
+    assert result.tool_calls[0].arguments == {"offset": 2**64 + 1}
+
+
 def test_generate_emits_api_usage_event_when_usage_present(monkeypatch):
     emitted: list[str] = []
 
@@ -354,3 +399,245 @@ def test_generate_result_defaults_usage_metadata_to_none_when_missing(monkeypatc
     assert result.prompt_tokens is None
     assert result.completion_tokens is None
     assert result.total_tokens is None
+
+
+def test_generate_reuses_one_client_until_closed(monkeypatch):
+    created = []
+
+    class _FakeClient:
+        def __init__(self, *args, **kwargs):
+            self.kwargs = kwargs
+            self.closed = False
+            created.append(self)
+
+        def post(self, *args, **kwargs):
+            return _FakeResponse(200, "", payload={"choices": [{"message": {"content": "ok"}}]})
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr("runtime.model_backend.httpx.Client", _FakeClient)
+
+    with OpenRouterBackend(api_key="test-key", model="openrouter/free") as backend:
+        for _ in range(3):
+            backend.generate(messages=[{"role": "user", "content": "task"}])
+        assert len(created) == 1
+        assert created[0].kwargs["headers"]["Authorization"] == "Bearer test-key"
+
+    assert created[0].closed
+    backend.generate(messages=[{"role": "user", "content": "task"}])
+    assert len(created) == 2
+
+
+def test_retry_backoff_uses_full_jitter_within_cap(monkeypatch):
+    slept = []
+    monkeypatch.setattr("runtime.model_backend.time.sleep", slept.append)
+    monkeypatch.setattr("runtime.model_backend.random.uniform", lambda low, high: high)
+
+    backend = OpenRouterBackend(
+        api_key="test-key",
+        model="openrouter/free",
+        initial_backoff_s=1.0,
+        max_backoff_s=5.0,
+    )
+    waits = [backend._sleep_before_retry(attempt) for attempt in range(5)]
+
+    assert waits == [1.0, 2.0, 4.0, 5.0, 5.0]
+    assert slept == waits
+    monkeypatch.setattr("runtime.model_backend.random.uniform", lambda low, high: low)
+    assert backend._sleep_before_retry(3) == 0.0
+
+
+def test_breaker_opens_after_exhausted_failures_and_recovers(monkeypatch):
+    calls = {"count": 0}
+    logs = []
+    status = {"code": 503}
+
+    class _FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def post(self, *args, **kwargs):
+            calls["count"] += 1
+            if status["code"] != 200:
+                return _FakeResponse(status["code"], "upstream down")
+            return _FakeResponse(200, "", payload={"choices": [{"message": {"content": "ok"}}]})
+
+    clock = {"now": 100.0}
+    monkeypatch.setattr("runtime.model_backend.httpx.Client", _FakeClient)
+    monkeypatch.setattr("runtime.model_backend.time.monotonic", lambda: clock["now"])
+    backend = OpenRouterBackend(
+        api_key="test-key",
+        model="openrouter/free",
+        max_retries=0,
+        event_logger=logs.append,
+        breaker_failure_threshold=2,
+        breaker_open_s=30.0,
+    )
+    messages = [{"role": "user", "content": "task"}]
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            backend.generate(messages=messages)
+    assert any(line.startswith("api_breaker_open") for line in logs)
+
+    with pytest.raises(RuntimeError, match="circuit_open"):
+        backend.generate(messages=messages)
+    assert calls["count"] == 2
+
+    clock["now"] += 31.0
+    status["code"] = 200
+    assert backend.generate(messages=messages).assistant_text == "ok"
+    assert any(line.startswith("api_breaker_close") for line in logs)
+    assert OpenRouterBackend._BREAKERS == {}
+
+
+def test_breaker_lets_exactly_one_probe_through_when_half_open(monkeypatch):
+    clock = {"now": 100.0}
+    monkeypatch.setattr("runtime.model_backend.time.monotonic", lambda: clock["now"])
+    backend = OpenRouterBackend(
+        api_key="test-key",
+        model="openrouter/free",
+        breaker_failure_threshold=1,
+        breaker_open_s=30.0,
+    )
+    backend._record_breaker_failure()
+    clock["now"] += 31.0
+
+    backend._check_breaker()
+    with pytest.raises(RuntimeError, match="probe in flight"):
+        backend._check_breaker()
+
+    backend._record_breaker_failure()
+    with pytest.raises(RuntimeError, match="remaining"):
+        backend._check_breaker()
+
+    clock["now"] += 31.0
+    backend._check_breaker()
+    backend._release_breaker_probe()
+    backend._check_breaker()
+    backend._record_breaker_success()
+    backend._check_breaker()
+    backend._check_breaker()
+    assert OpenRouterBackend._BREAKERS == {}
+
+
+def test_breaker_releases_probe_when_interrupted(monkeypatch):
+    class _InterruptingClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def post(self, *args, **kwargs):
+            raise KeyboardInterrupt
+
+    clock = {"now": 100.0}
+    monkeypatch.setattr("runtime.model_backend.httpx.Client", _InterruptingClient)
+    monkeypatch.setattr("runtime.model_backend.time.monotonic", lambda: clock["now"])
+    backend = OpenRouterBackend(
+        api_key="test-key",
+        model="openrouter/free",
+        max_retries=0,
+        breaker_failure_threshold=1,
+        breaker_open_s=30.0,
+    )
+    backend._record_breaker_failure()
+    clock["now"] += 31.0
+
+    with pytest.raises(KeyboardInterrupt):
+        backend.generate(messages=[{"role": "user", "content": "task"}])
+
+    backend._check_breaker()
+
+
+def test_breaker_ignores_non_retryable_client_errors(monkeypatch):
+    class _FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def post(self, *args, **kwargs):
+            return _FakeResponse(400, '{"error":{"message":"Invalid request body"}}')
+
+    monkeypatch.setattr("runtime.model_backend.httpx.Client", _FakeClient)
+    backend = OpenRouterBackend(
+        api_key="test-key", model="openrouter/free", max_retries=0, breaker_failure_threshold=1
+    )
+    for _ in range(3):
+        with pytest.raises(httpx.HTTPStatusError):
+            backend.generate(messages=[{"role": "user", "content": "task"}])
+    assert OpenRouterBackend._BREAKERS == {}
+
+
+def test_generate_sends_json_bytes_and_retries_undecodable_body(monkeypatch):
+    sent = []
+    bodies = [b"<html>gateway</html>", b'{"choices":[{"message":{"content":"ok"}}]}']
+
+    class _RawResponse:
+        status_code = 200
+        text = ""
+
+        def __init__(self, content: bytes):
+            self.content = content
+
+    class _FakeClient:
+        def __init__(self, *args, **kwargs):
+            self.headers = kwargs["headers"]
+
+        def post(self, url, **kwargs):
+            sent.append(kwargs)
+            return _RawResponse(bodies[len(sent) - 1])
+
+    monkeypatch.setattr("runtime.model_backend.httpx.Client", _FakeClient)
+    backend = OpenRouterBackend(
+        api_key="test-key",
+        model="openrouter/free",
+        max_retries=1,
+        initial_backoff_s=0,
+        max_backoff_s=0,
+    )
+    result = backend.generate(messages=[{"role": "user", "content": "é"}])
+
+    assert result.assistant_text == "ok"
+    assert backend._client.headers["Content-Type"] == "application/json"
+    assert sent[0]["content"] is sent[1]["content"]
+    assert json.loads(sent[0]["content"]) == {
+        "model": "openrouter/free",
+        "messages": [{"role": "user", "content": "é"}],
+    }
+
+
+def test_generate_skips_payload_serialization_without_log_sink(monkeypatch):
+    class _FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def post(self, *args, **kwargs):
+            return _FakeResponse(200, "", payload={"choices": [{"message": {"content": "ok"}}]})
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("log payload should not be rendered without an event logger")
+
+    monkeypatch.setattr("runtime.model_backend.httpx.Client", _FakeClient)
+    monkeypatch.setattr(OpenRouterBackend, "_preview_text", staticmethod(_fail))
+    backend = OpenRouterBackend(api_key="test-key", model="openrouter/free")
+    assert backend.generate(messages=[{"role": "user", "content": "task"}]).assistant_text == "ok"
+
+
+def test_generate_skips_text_decode_for_successful_response_without_log_sink(monkeypatch):
+    class _NoTextResponse:
+        status_code = 200
+        content = b'{"choices":[{"message":{"content":"ok"}}]}'
+
+        @property
+        def text(self) -> str:
+            raise AssertionError("response text should not be decoded on the success path")
+
+    class _FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def post(self, *args, **kwargs):
+            return _NoTextResponse()
+
+    monkeypatch.setattr("runtime.model_backend.httpx.Client", _FakeClient)
+    backend = OpenRouterBackend(api_key="test-key", model="openrouter/free")
+    assert backend.generate(messages=[{"role": "user", "content": "task"}]).assistant_text == "ok"
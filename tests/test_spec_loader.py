@@ -283,3 +283,99 @@ decoding_defaults: {}
     loader = AgentSpecLoader(tmp_path)
     with pytest.raises(ValueError, match="agent_architecture_config"):
         loader.load(agent_yaml)
+
+
+def test_agent_spec_load_is_cached_until_skill_file_changes(tmp_path: Path):
+    skills_dir = tmp_path / "skills" / "s1"
+    skills_dir.mkdir(parents=True)
+    skill_file = skills_dir / "SKILL.md"
+    skill_file.write_text("Allowed Tools:\n- submit\n")
+
+    agent_yaml = tmp_path / "agent.yaml"
+    agent_yaml.write_text(
+        """
+name: test
+backend: {type: openrouter, model: x}
+prompt_template: "Hi {skills}"
+skills: [s1]
+tool_to_skill_map: {}
+termination: {tool: submit}
+decoding_defaults: {}
+"""
+    )
+
+    loader = AgentSpecLoader(tmp_path)
+    spec, prompt, allowed = loader.load(agent_yaml)
+    allowed.add("mutated")
+    spec.backend["model"] = "mutated"
+    spec.skills.append("mutated")
+    spec_again, prompt_again, allowed_again = loader.load(agent_yaml)
+
+    assert spec_again is not spec
+    assert spec_again.backend == {"type": "openrouter", "model": "x"}
+    assert spec_again.skills == ["s1"]
+    assert prompt_again == prompt
+    assert allowed_again == {"submit"}
+
+    skill_file.write_text("Allowed Tools:\n- submit\n- workspace_open\n")
+    spec_reloaded, _prompt, allowed_reloaded = loader.load(agent_yaml)
+
+    assert spec_reloaded is not spec
+    assert allowed_reloaded == {"submit", "workspace_open"}
+
+
+def test_agent_spec_load_cache_is_shared_across_loaders(monkeypatch, tmp_path: Path):
+    agent_yaml = tmp_path / "agent.yaml"
+    agent_yaml.write_text(
+        """
+name: test
+backend: {type: openrouter, model: x}
+prompt_template: "Hi"
+tool_to_skill_map: {}
+termination: {tool: submit}
+decoding_defaults: {}
+"""
+    )
+
+    parses = []
+    real_load_uncached = AgentSpecLoader._load_uncached
+    monkeypatch.setattr(
+        AgentSpecLoader,
+        "_load_uncached",
+        lambda self, *a, **k: parses.append(1) or real_load_uncached(self, *a, **k),
+    )
+
+    spec, _prompt, _allowed = AgentSpecLoader(tmp_path).load(agent_yaml)
+    spec_again, _prompt_again, _allowed_again = AgentSpecLoader(tmp_path).load(agent_yaml)
+
+    assert len(parses) == 1
+    assert spec_again == spec
+    assert spec_again is not spec
+
+
+def test_agent_spec_prompt_file_falls_back_to_base_dir(tmp_path: Path):
+    prompt_file = tmp_path / "prompts" / "agent_prompt.txt"
+    prompt_file.parent.mkdir(parents=True, exist_ok=True)
+    prompt_file.write_text("Prompt from base dir\n", encoding="utf-8")
+
+    agent_dir = tmp_path / "profiles" / "agents"
+    agent_dir.mkdir(parents=True)
+    agent_yaml = agent_dir / "agent.yaml"
+    agent_yaml.write_text(
+        """
+name: test
+backend: {type: openrouter, model: x}
+prompt_file: prompts/agent_prompt.txt
+tool_to_skill_map: {}
+termination: {tool: submit}
+decoding_defaults: {}
+"""
+    )
+
+    loader = AgentSpecLoader(tmp_path)
+    _spec, prompt, _allowed = loader.load(agent_yaml)
+    assert prompt == "Prompt from base dir\n"
+
+    prompt_file.unlink()
+    with pytest.raises(FileNotFoundError, match="Prompt file not found"):
+        loader.load(agent_yaml)
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
 
+from benchmarks.swebench_verified import adapter as adapter_module
 from benchmarks.swebench_verified.adapter import SWEbenchVerifiedAdapter
 from runtime.schemas import BenchmarkTask
 
 
+@pytest.fixture(autouse=True)
+def _clear_hf_split_cache():
+    adapter_module._load_hf_split.cache_clear()
+    yield
+    adapter_module._load_hf_split.cache_clear()
+
+
 def test_local_source_requires_data_root():
     adapter = SWEbenchVerifiedAdapter(data_source="local", data_root=None)
     with pytest.raises(ValueError, match="data_root is required"):
@@ -24,17 +33,20 @@ def test_hf_loader_uses_requested_split_without_remap(monkeypatch):
     captured = {"split": None}
 
     class _FakeDataset:
-        def __len__(self):
-            return 1
-
-        def select(self, _indices):
-            return [
-                {
-                    "instance_id": "astropy__astropy-12907",
-                    "problem_statement": "Fix issue",
-                    "repo": "astropy/astropy",
-                }
-            ]
+        column_names = ["instance_id", "problem_statement", "repo", "patch"]
+        features: dict = {}
+
+        def select_columns(self, column_names):
+            assert "patch" not in column_names
+            return self
+
+        def __iter__(self):
+            yield {
+                "instance_id": "astropy__astropy-12907",
+                "problem_statement": "Fix issue",
+                "repo": "astropy/astropy",
+            }
+            raise AssertionError("loader must stop iterating once selector is satisfied")
 
     def _fake_load_dataset(dataset_name: str, split: str):
         captured["split"] = split
@@ -138,10 +150,83 @@ def test_local_loader_repo_allowlist_filters_before_selector(tmp_path: Path):
     assert [t.task_id for t in tasks] == ["astropy__1", "astropy__2"]
 
 
+def test_local_loader_without_selector_loads_every_row(tmp_path: Path):
+    split_path = tmp_path / "test.jsonl"
+    split_path.write_text(
+        '{"instance_id": "a__1", "problem_statement": "Fix \\u00e9", "repo": "a/a"}\n'
+        '{"instance_id": "b__1", "problem_statement": "Fix b", "repo": "b/b"}\n',
+        encoding="utf-8",
+    )
+    adapter = SWEbenchVerifiedAdapter(data_source="local", data_root=str(tmp_path))
+
+    tasks = adapter.load_tasks(split="test", selector=None)
+
+    assert [(t.task_id, t.instruction) for t in tasks] == [("a__1", "Fix é"), ("b__1", "Fix b")]
+
+
+def test_local_loader_rejects_non_object_rows_without_selector(tmp_path: Path):
+    split_path = tmp_path / "test.jsonl"
+    split_path.write_text('{"instance_id": "a__1", "problem_statement": "Fix a"}\n[1, 2]\n', encoding="utf-8")
+    adapter = SWEbenchVerifiedAdapter(data_source="local", data_root=str(tmp_path))
+
+    with pytest.raises(ValueError, match="expected object, got list"):
+        adapter.load_tasks(split="test", selector=None)
+
+
+def test_local_loader_selector_stops_before_later_rows(tmp_path: Path):
+    split_path = tmp_path / "test.jsonl"
+    split_path.write_text(
+        '{"instance_id": "a__1", "problem_statement": "Fix a"}\r\n{not json}\n',
+        encoding="utf-8",
+    )
+    adapter = SWEbenchVerifiedAdapter(data_source="local", data_root=str(tmp_path))
+
+    tasks = adapter.load_tasks(split="test", selector=1)
+
+    assert [t.task_id for t in tasks] == ["a__1"]
+
+
+def test_local_loader_empty_split_yields_no_tasks(tmp_path: Path):
+    (tmp_path / "test.jsonl").write_bytes(b"")
+    adapter = SWEbenchVerifiedAdapter(data_source="local", data_root=str(tmp_path))
+
+    assert adapter.load_tasks(split="test", selector=3) == []
+    assert adapter.load_tasks(split="test", selector=None) == []
+
+
+@pytest.mark.parametrize("selector", [None, 5])
+def test_local_loader_rejects_two_objects_on_one_line(tmp_path: Path, selector):
+    (tmp_path / "test.jsonl").write_text(
+        '{"instance_id": "a__1", "problem_statement": "Fix a"},'
+        '{"instance_id": "b__1", "problem_statement": "Fix b"}\n',
+        encoding="utf-8",
+    )
+    adapter = SWEbenchVerifiedAdapter(data_source="local", data_root=str(tmp_path))
+
+    with pytest.raises(json.JSONDecodeError, match="char 53"):
+        adapter.load_tasks(split="test", selector=selector)
+
+
+@pytest.mark.parametrize("selector", [None, 5])
+def test_local_loader_rejects_blank_only_split(tmp_path: Path, selector):
+    (tmp_path / "test.jsonl").write_text("\n\n", encoding="utf-8")
+    adapter = SWEbenchVerifiedAdapter(data_source="local", data_root=str(tmp_path))
+
+    with pytest.raises(json.JSONDecodeError):
+        adapter.load_tasks(split="test", selector=selector)
+
+
 def test_hf_loader_repo_allowlist_filters_before_selector(monkeypatch):
     captured = {"split": None}
 
     class _FakeDataset:
+        column_names = ["instance_id", "problem_statement", "repo", "patch"]
+        features: dict = {}
+
+        def select_columns(self, column_names):
+            assert "patch" not in column_names
+            return self
+
         def __iter__(self):
             yield {
                 "instance_id": "django__1",
@@ -174,3 +259,55 @@ def test_hf_loader_repo_allowlist_filters_before_selector(monkeypatch):
 
     assert captured["split"] == "test"
     assert [t.task_id for t in tasks] == ["astropy__1", "astropy__2"]
+
+
+def test_hf_loader_reuses_loaded_split_across_adapters(monkeypatch):
+    calls: list[tuple[str, str]] = []
+
+    class _FakeDataset:
+        column_names = ["instance_id", "problem_statement", "repo"]
+        features: dict = {}
+
+        def select_columns(self, column_names):
+            return self
+
+        def __iter__(self):
+            yield {
+                "instance_id": "astropy__astropy-12907",
+                "problem_statement": "Fix issue",
+                "repo": "astropy/astropy",
+            }
+
+    def _fake_load_dataset(dataset_name: str, split: str):
+        calls.append((dataset_name, split))
+        return _FakeDataset()
+
+    monkeypatch.setattr("datasets.load_dataset", _fake_load_dataset)
+
+    for _ in range(2):
+        adapter = SWEbenchVerifiedAdapter(data_source="hf", dataset_name="SWE-bench/SWE-bench_Verified")
+        assert [t.task_id for t in adapter.load_tasks(split="test", selector=1)] == ["astropy__astropy-12907"]
+
+    assert calls == [("SWE-bench/SWE-bench_Verified", "test")]
+
+
+def test_hf_loader_string_schema_uses_trusted_rows(monkeypatch):
+    datasets = pytest.importorskip("datasets")
+    ds = datasets.Dataset.from_dict(
+        {
+            "instance_id": ["  astropy__1 ", "astropy__2"],
+            "problem_statement": ["   ", "Fix astropy issue 2"],
+            "title": ["Fix astropy issue 1", None],
+            "repo": ["astropy/astropy", None],
+            "patch": ["diff", "diff"],
+        }
+    )
+    monkeypatch.setattr("datasets.load_dataset", lambda dataset_name, split: ds)
+
+    adapter = SWEbenchVerifiedAdapter(data_source="hf", dataset_name="local/strings")
+    tasks = adapter.load_tasks(split="test", selector=None)
+
+    assert [(t.task_id, t.instruction, t.resources) for t in tasks] == [
+        ("astropy__1", "Fix astropy issue 1", {"repo": "astropy/astropy"}),
+        ("astropy__2", "Fix astropy issue 2", {}),
+    ]
@@ -71,12 +71,8 @@ def test_run_harness_relocates_summary_report_to_report_dir(monkeypatch, tmp_pat
         source_path.write_text("{}", encoding="utf-8")
         source_harness_logs.mkdir(parents=True, exist_ok=True)
         (source_harness_logs / "run_instance.log").write_text("hello", encoding="utf-8")
-        return subprocess.CompletedProcess(
-            args=args[0] if args else "",
-            returncode=0,
-            stdout=f"Report written to {source_name}\n",
-            stderr="",
-        )
+        kwargs["stdout"].write(f"Report written to {source_name}\n".encode("utf-8"))
+        return subprocess.CompletedProcess(args=args[0] if args else "", returncode=0)
 
     monkeypatch.setattr(subprocess, "run", _fake_run)
     proc = evaluator.run_harness(predictions_path=predictions_path, run_id=run_id, config=cfg)
@@ -94,6 +90,10 @@ def test_run_harness_relocates_summary_report_to_report_dir(monkeypatch, tmp_pat
     assert evaluator.last_harness_log_root == relocated_harness.resolve()
     assert "Report relocated to" in proc.stdout
     assert "Harness logs relocated to" in proc.stdout
+    assert f"Report written to {source_name}" in proc.stdout
+    assert (artifacts_dir / run_id / "harness.stdout.log").read_text(encoding="utf-8") == (
+        f"Report written to {source_name}\n"
+    )
 
 
 def test_run_harness_relocates_with_instance_collision(monkeypatch, tmp_path: Path):
@@ -134,12 +134,8 @@ def test_run_harness_relocates_with_instance_collision(monkeypatch, tmp_path: Pa
         model_b.mkdir(parents=True, exist_ok=True)
         (model_a / "run_instance.log").write_text("a", encoding="utf-8")
         (model_b / "run_instance.log").write_text("b", encoding="utf-8")
-        return subprocess.CompletedProcess(
-            args=args[0] if args else "",
-            returncode=0,
-            stdout=f"Report written to {source_name}\n",
-            stderr="",
-        )
+        kwargs["stdout"].write(f"Report written to {source_name}\n".encode("utf-8"))
+        return subprocess.CompletedProcess(args=args[0] if args else "", returncode=0)
 
     monkeypatch.setattr(subprocess, "run", _fake_run)
     evaluator.run_harness(predictions_path=predictions_path, run_id=run_id, config=cfg)
@@ -149,6 +145,172 @@ def test_run_harness_relocates_with_instance_collision(monkeypatch, tmp_path: Pa
     assert (dest_root / "same-instance__model-b").exists()
 
 
+def test_run_harness_keeps_report_already_in_run_root(monkeypatch, tmp_path: Path):
+    workdir = tmp_path / "work"
+    workdir.mkdir(parents=True)
+    eval_root = tmp_path / "external" / "SWE-bench"
+    eval_root.mkdir(parents=True)
+    artifacts_dir = tmp_path / "artifacts"
+    artifacts_dir.mkdir(parents=True)
+
+    predictions_path = tmp_path / "predictions.jsonl"
+    predictions_path.write_text(
+        json.dumps(
+            {
+                "instance_id": "astropy__astropy-12907",
+                "model_patch": "",
+                "model_name_or_path": "qwen/qwen3-coder:free",
+                "model_name": "qwen3-coder-free",
+                "repo": "astropy/astropy",
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    cfg = _run_config(artifacts_dir=artifacts_dir, eval_root=eval_root, workdir=workdir)
+    evaluator = SWEbenchEvaluator()
+    run_id = "2026-02-12_165545"
+    report_path = artifacts_dir / run_id / "report.json"
+
+    def _fake_run(*args, **kwargs):
+        report_path.write_text('{"resolved_instances": 1}', encoding="utf-8")
+        kwargs["stdout"].write(f"Report written to {report_path.resolve()}\n".encode("utf-8"))
+        return subprocess.CompletedProcess(args=args[0] if args else "", returncode=0)
+
+    monkeypatch.setattr(subprocess, "run", _fake_run)
+    evaluator.run_harness(predictions_path=predictions_path, run_id=run_id, config=cfg)
+
+    assert evaluator.last_summary_report == report_path.resolve()
+    assert report_path.read_text(encoding="utf-8") == '{"resolved_instances": 1}'
+
+
+def test_run_harness_reports_missing_harness_binary_as_rc_127(monkeypatch, tmp_path: Path):
+    workdir = tmp_path / "work"
+    workdir.mkdir(parents=True)
+    eval_root = tmp_path / "external" / "SWE-bench"
+    eval_root.mkdir(parents=True)
+    artifacts_dir = tmp_path / "artifacts"
+    artifacts_dir.mkdir(parents=True)
+
+    predictions_path = tmp_path / "predictions.jsonl"
+    predictions_path.write_text(
+        json.dumps(
+            {
+                "instance_id": "astropy__astropy-12907",
+                "model_patch": "",
+                "model_name_or_path": "qwen/qwen3-coder:free",
+                "model_name": "qwen3-coder-free",
+                "repo": "astropy/astropy",
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    cfg = _run_config(artifacts_dir=artifacts_dir, eval_root=eval_root, workdir=workdir)
+    evaluator = SWEbenchEvaluator()
+    run_id = "2026-02-12_165547"
+
+    def _fake_run(*args, **kwargs):
+        raise FileNotFoundError(2, "No such file or directory", "python")
+
+    monkeypatch.setattr(subprocess, "run", _fake_run)
+    proc = evaluator.run_harness(predictions_path=predictions_path, run_id=run_id, config=cfg)
+
+    assert proc.returncode == 127
+    assert "No such file or directory" in proc.stderr
+    stderr_log = artifacts_dir / run_id / "harness.stderr.log"
+    assert "No such file or directory" in stderr_log.read_text(encoding="utf-8")
+
+
+def test_run_harness_keeps_bounded_log_tail_and_scans_full_stdout_log(monkeypatch, tmp_path: Path):
+    workdir = tmp_path / "work"
+    workdir.mkdir(parents=True)
+    eval_root = tmp_path / "external" / "SWE-bench"
+    eval_root.mkdir(parents=True)
+    artifacts_dir = tmp_path / "artifacts"
+    artifacts_dir.mkdir(parents=True)
+
+    predictions_path = tmp_path / "predictions.jsonl"
+    predictions_path.write_text(
+        json.dumps(
+            {
+                "instance_id": "astropy__astropy-12907",
+                "model_patch": "",
+                "model_name_or_path": "qwen/qwen3-coder:free",
+                "model_name": "qwen3-coder-free",
+                "repo": "astropy/astropy",
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    cfg = _run_config(artifacts_dir=artifacts_dir, eval_root=eval_root, workdir=workdir)
+    evaluator = SWEbenchEvaluator()
+    run_id = "2026-02-12_165548"
+    source_name = f"qwen__qwen3-coder:free.{run_id}.json"
+
+    def _fake_run(*args, **kwargs):
+        (workdir / source_name).write_text("{}", encoding="utf-8")
+        kwargs["stdout"].write(f"Report written to {source_name}\n".encode("utf-8"))
+        kwargs["stdout"].write(b"x" * (256 * 1024) + b"\n")
+        return subprocess.CompletedProcess(args=args[0] if args else "", returncode=0)
+
+    monkeypatch.setattr(subprocess, "run", _fake_run)
+    proc = evaluator.run_harness(predictions_path=predictions_path, run_id=run_id, config=cfg)
+
+    stdout_log = artifacts_dir / run_id / "harness.stdout.log"
+    assert evaluator.last_summary_report == (artifacts_dir / run_id / "report.json").resolve()
+    assert f"Report written to {source_name}" not in proc.stdout
+    assert f"full log: {stdout_log}" in proc.stdout
+    assert len(proc.stdout) < 80 * 1024
+
+
+def test_run_harness_passes_captured_stdout_to_resolve_summary_report_override(
+    monkeypatch, tmp_path: Path
+):
+    workdir = tmp_path / "work"
+    workdir.mkdir(parents=True)
+    eval_root = tmp_path / "external" / "SWE-bench"
+    eval_root.mkdir(parents=True)
+    artifacts_dir = tmp_path / "artifacts"
+    artifacts_dir.mkdir(parents=True)
+
+    predictions_path = tmp_path / "predictions.jsonl"
+    predictions_path.write_text(
+        json.dumps(
+            {
+                "instance_id": "astropy__astropy-12907",
+                "model_patch": "",
+                "model_name_or_path": "qwen/qwen3-coder:free",
+                "model_name": "qwen3-coder-free",
+                "repo": "astropy/astropy",
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    seen = []
+
+    class _CustomEvaluator(SWEbenchEvaluator):
+        def resolve_summary_report(self, stdout, run_id, run_root):  # noqa: ANN001, ANN201
+            seen.append((stdout, run_id, run_root))
+            return None
+
+    def _fake_run(*args, **kwargs):
+        kwargs["stdout"].write(b"Report written to custom.json\n")
+        return subprocess.CompletedProcess(args=args[0] if args else "", returncode=0)
+
+    monkeypatch.setattr(subprocess, "run", _fake_run)
+    cfg = _run_config(artifacts_dir=artifacts_dir, eval_root=eval_root, workdir=workdir)
+    run_id = "2026-02-12_165549"
+    _CustomEvaluator().run_harness(predictions_path=predictions_path, run_id=run_id, config=cfg)
+
+    assert seen == [("Report written to custom.json\n", run_id, artifacts_dir / run_id)]
+
+
 def test_build_command_uses_shadow_predictions_when_patch_missing_trailing_newline(tmp_path: Path):
     workdir = tmp_path / "work"
     workdir.mkdir(parents=True)
@@ -186,7 +348,7 @@ def test_build_command_uses_shadow_predictions_when_patch_missing_trailing_newli
 
     shadow_path = artifacts_dir / run_id / "predictions.for_harness.jsonl"
     assert shadow_path.exists() is True
-    assert f"-p {shadow_path.resolve()} " in cmd
+    assert cmd[cmd.index("-p") + 1] == str(shadow_path.resolve())
 
     original_record = json.loads(predictions_path.read_text(encoding="utf-8").strip())
     shadow_record = json.loads(shadow_path.read_text(encoding="utf-8").strip())
@@ -194,6 +356,40 @@ def test_build_command_uses_shadow_predictions_when_patch_missing_trailing_newli
     assert shadow_record["model_patch"] == raw_patch + "\n"
 
 
+def test_build_command_decodes_only_flagged_rows_again_for_shadow(monkeypatch, tmp_path: Path):
+    import benchmarks.swebench_verified.evaluator as evaluator_module
+
+    workdir = tmp_path / "work"
+    workdir.mkdir(parents=True)
+    eval_root = tmp_path / "external" / "SWE-bench"
+    eval_root.mkdir(parents=True)
+    artifacts_dir = tmp_path / "artifacts"
+    artifacts_dir.mkdir(parents=True)
+    predictions_path = tmp_path / "predictions.jsonl"
+    rows = [
+        {"instance_id": f"a__{idx}", "model_patch": patch, "model_name_or_path": "m"}
+        for idx, patch in enumerate(["x\n", "y", "", "z\n"])
+    ]
+    original_lines = [json.dumps(row) + "\n" for row in rows]
+    predictions_path.write_text("".join(original_lines), encoding="utf-8")
+
+    decoded = []
+    real_loads = evaluator_module.json_codec.loads
+    monkeypatch.setattr(
+        evaluator_module.json_codec, "loads", lambda data: decoded.append(data) or real_loads(data)
+    )
+    cfg = _run_config(artifacts_dir=artifacts_dir, eval_root=eval_root, workdir=workdir)
+    run_id = "2026-02-13_010206"
+    SWEbenchEvaluator().build_command(predictions_path=predictions_path, run_id=run_id, config=cfg)
+
+    assert len(decoded) == len(rows) + 1
+    shadow_lines = (artifacts_dir / run_id / "predictions.for_harness.jsonl").read_text("utf-8")
+    shadow_lines = shadow_lines.splitlines(keepends=True)
+    assert shadow_lines[0] == original_lines[0]
+    assert json.loads(shadow_lines[1])["model_patch"] == "y\n"
+    assert shadow_lines[2:] == original_lines[2:]
+
+
 def test_build_command_uses_original_predictions_when_patch_is_already_normalized(tmp_path: Path):
     workdir = tmp_path / "work"
     workdir.mkdir(parents=True)
@@ -231,7 +427,8 @@ def test_build_command_uses_original_predictions_when_patch_is_already_normalize
 
     shadow_path = artifacts_dir / run_id / "predictions.for_harness.jsonl"
     assert shadow_path.exists() is False
-    assert f"-p {predictions_path.resolve()} " in cmd
+    assert cmd[:3] == ["python", "-m", "swebench.harness.run_evaluation"]
+    assert cmd[cmd.index("-p") + 1] == str(predictions_path.resolve())
 
 
 def test_run_harness_fails_when_model_name_or_path_missing(tmp_path: Path):
@@ -263,3 +460,30 @@ def test_run_harness_fails_when_model_name_or_path_missing(tmp_path: Path):
             run_id="2026-02-13_010203",
             config=cfg,
         )
+
+
+def test_relocate_harness_logs_flattens_instances_with_collision_suffixes(tmp_path: Path):
+    workdir = tmp_path / "work"
+    run_id = "2026-02-13_010206"
+    source = workdir / "logs" / "run_evaluation" / run_id
+    for model_name in ("model_a", "model_b"):
+        instance_dir = source / model_name / "astropy__astropy-12907"
+        instance_dir.mkdir(parents=True)
+        (instance_dir / "report.json").write_text(model_name, encoding="utf-8")
+    (source / "model_a" / "stray.txt").write_text("x", encoding="utf-8")
+    run_root = tmp_path / "artifacts" / run_id
+    stale = run_root / "evaluation" / "stale"
+    stale.mkdir(parents=True)
+
+    evaluator = SWEbenchEvaluator()
+    evaluator._workdir = workdir
+    destination = evaluator.relocate_harness_logs(run_id=run_id, run_root=run_root)
+
+    assert destination == (run_root / "evaluation").resolve()
+    assert sorted(p.name for p in destination.iterdir()) == [
+        "astropy__astropy-12907",
+        "astropy__astropy-12907__model_b",
+    ]
+    assert (destination / "astropy__astropy-12907" / "report.json").read_text(encoding="utf-8") == "model_a"
+    assert (destination / "stale").exists() is False
+    assert source.exists() is False
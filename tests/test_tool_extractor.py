@@ -1,3 +1,5 @@
+import json
+
 import httpx
 
 from runtime.model_backend import OpenRouterBackend
@@ -10,8 +12,9 @@ class _FakeResponse:
         self._payload = payload
         self.request = httpx.Request("POST", "https://openrouter.test/chat/completions")
 
-    def json(self):
-        return self._payload
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
 
 
 def test_generate_parses_structured_tool_calls(monkeypatch):